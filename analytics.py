@@ -0,0 +1,247 @@
+"""This module exports finished turns and aggregates per-word card statistics.
+
+Turns are streamed one record at a time, either from live games or from
+snapshot files written by the serialization module, and written out as JSONL
+or CSV. The aggregator reads those exports back in a single pass and keeps
+only one running total per card word in memory.
+
+Usage:
+    python analytics.py export SNAPSHOT [SNAPSHOT ...] -o turns.jsonl
+    python analytics.py aggregate turns.jsonl [turns.csv ...]
+"""
+
+import argparse
+import csv
+import json
+import sys
+from dataclasses import dataclass, asdict
+from typing import IO, Iterable, Iterator
+
+from backend import Game, Team, Turn
+from serialization import iter_turns
+
+OUTCOME_GUESSED = "guessed"
+OUTCOME_TABOOED = "tabooed"
+OUTCOME_CHEAT_CLAIMED = "cheat_claimed"
+OUTCOME_FAILED = "failed"
+
+FIELDS = [
+    "game_id",
+    "turn",
+    "guessing_team",
+    "word",
+    "taboo_words",
+    "hints",
+    "guesses",
+    "hint_count",
+    "guess_count",
+    "score_a",
+    "score_b",
+    "outcome",
+    "created_at",
+    "ended_at",
+]
+
+LIST_SEPARATOR = "|"
+
+
+def guessing_team_for(turn_number: int) -> Team:
+    """Return the guessing team of a turn, mirroring Game.guessing_team."""
+    return Team.B if turn_number % 2 == 0 else Team.A
+
+
+def turn_outcome(turn: Turn, guessing_team: Team) -> str:
+    """Classify how a finished turn ended."""
+    if turn.successfully_guessed:
+        return OUTCOME_GUESSED
+    if turn.tabooed:
+        return OUTCOME_TABOOED
+
+    checking_index = 1 if guessing_team == Team.A else 0
+    if turn.score[checking_index] > 0:
+        return OUTCOME_CHEAT_CLAIMED
+    return OUTCOME_FAILED
+
+
+def turn_record(turn: Turn, turn_number: int, game_id: str = "") -> dict:
+    """Build the export record of a single finished turn."""
+    guessing_team = guessing_team_for(turn_number)
+    return {
+        "game_id": game_id,
+        "turn": turn_number,
+        "guessing_team": guessing_team.value,
+        "word": turn.card.word,
+        "taboo_words": list(turn.card.taboo_words),
+        "hints": list(turn.hints),
+        "guesses": list(turn.guesses),
+        "hint_count": len(turn.hints),
+        "guess_count": len(turn.guesses),
+        "score_a": turn.score[0],
+        "score_b": turn.score[1],
+        "outcome": turn_outcome(turn, guessing_team),
+        "created_at": turn.card.created_at.isoformat(),
+        "ended_at": turn.ended_at.isoformat() if turn.ended_at else None,
+    }
+
+
+def iter_turn_records(turns: Iterable[Turn], game_id: str = "") -> Iterator[dict]:
+    """Yield export records for the finished turns of one game."""
+    for turn_number, turn in enumerate(turns, start=1):
+        if turn.end_turn:
+            yield turn_record(turn, turn_number, game_id)
+
+
+def iter_game_records(game: Game, game_id: str = "") -> Iterator[dict]:
+    """Yield export records for the finished turns of a live game."""
+    return iter_turn_records(game.turns, game_id)
+
+
+def iter_snapshot_records(paths: Iterable[str]) -> Iterator[dict]:
+    """Yield export records from snapshot files, one turn at a time."""
+    for path in paths:
+        with open(path, "rb") as f:
+            yield from iter_turn_records(iter_turns(f), game_id=path)
+
+
+def write_jsonl(records: Iterable[dict], fp: IO[str]) -> int:
+    """Write records as JSON lines and return how many were written."""
+    count = 0
+    for record in records:
+        fp.write(json.dumps(record, separators=(",", ":")))
+        fp.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(records: Iterable[dict], fp: IO[str]) -> int:
+    """Write records as CSV and return how many were written."""
+    writer = csv.DictWriter(fp, fieldnames=FIELDS)
+    writer.writeheader()
+    count = 0
+    for record in records:
+        row = dict(record)
+        for key in ("taboo_words", "hints", "guesses"):
+            row[key] = LIST_SEPARATOR.join(row[key])
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def read_records(path: str) -> Iterator[dict]:
+    """Stream records back from a JSONL or CSV export."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if path.endswith(".csv"):
+            for row in csv.DictReader(f):
+                row["guess_count"] = int(row["guess_count"])
+                row["hint_count"] = int(row["hint_count"])
+                yield row
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+@dataclass
+class WordStats:
+    """Data class to hold running statistics for one card word."""
+
+    word: str
+    plays: int = 0
+    guessed: int = 0
+    tabooed: int = 0
+    cheat_claimed: int = 0
+    failed: int = 0
+    total_hints: int = 0
+    guesses_when_guessed: int = 0
+
+    def add(self, record: dict):
+        """Fold one turn record into the statistics."""
+        self.plays += 1
+        self.total_hints += record["hint_count"]
+
+        outcome = record["outcome"]
+        if outcome == OUTCOME_GUESSED:
+            self.guessed += 1
+            self.guesses_when_guessed += record["guess_count"]
+        elif outcome == OUTCOME_TABOOED:
+            self.tabooed += 1
+        elif outcome == OUTCOME_CHEAT_CLAIMED:
+            self.cheat_claimed += 1
+        else:
+            self.failed += 1
+
+    @property
+    def guess_rate(self) -> float:
+        """Fraction of plays in which the word was guessed."""
+        return self.guessed / self.plays if self.plays else 0.0
+
+    @property
+    def mean_guesses_needed(self) -> float:
+        """Average number of guesses on turns where the word was guessed."""
+        return self.guesses_when_guessed / self.guessed if self.guessed else 0.0
+
+    @property
+    def mean_hints(self) -> float:
+        """Average number of hints given per play."""
+        return self.total_hints / self.plays if self.plays else 0.0
+
+
+def aggregate(records: Iterable[dict]) -> dict[str, WordStats]:
+    """Compute per-word statistics over a stream of records in one pass."""
+    stats: dict[str, WordStats] = {}
+    for record in records:
+        word = record["word"]
+        word_stats = stats.get(word)
+        if word_stats is None:
+            word_stats = stats[word] = WordStats(word=word)
+        word_stats.add(record)
+    return stats
+
+
+def write_stats_csv(stats: dict[str, WordStats], fp: IO[str]):
+    """Write per-word statistics as CSV, hardest words first."""
+    fieldnames = list(WordStats.__dataclass_fields__) + [
+        "guess_rate",
+        "mean_guesses_needed",
+        "mean_hints",
+    ]
+    writer = csv.DictWriter(fp, fieldnames=fieldnames)
+    writer.writeheader()
+    for word_stats in sorted(stats.values(), key=lambda s: (s.guess_rate, s.word)):
+        row = asdict(word_stats)
+        row["guess_rate"] = round(word_stats.guess_rate, 4)
+        row["mean_guesses_needed"] = round(word_stats.mean_guesses_needed, 4)
+        row["mean_hints"] = round(word_stats.mean_hints, 4)
+        writer.writerow(row)
+
+
+def main(argv: list[str] | None = None):
+    """Run the analytics command line interface."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="Export finished turns.")
+    export_parser.add_argument("snapshots", nargs="+")
+    export_parser.add_argument("-o", "--output", required=True)
+
+    aggregate_parser = commands.add_parser("aggregate", help="Per-word statistics.")
+    aggregate_parser.add_argument("exports", nargs="+")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        records = iter_snapshot_records(args.snapshots)
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            if args.output.endswith(".csv"):
+                count = write_csv(records, f)
+            else:
+                count = write_jsonl(records, f)
+        print(f"Exported {count} turns to {args.output}")
+
+    else:
+        records = (record for path in args.exports for record in read_records(path))
+        write_stats_csv(aggregate(records), sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,31 @@ import streamlit as st
 from components import (
     display_player_state,
     add_player,
+    card_queue_controls,
     game_controls,
     display_main_interface,
+    display_leaderboard,
+    display_room_chat,
+    get_latency_tracer,
+    get_rooms,
+    get_shared_game,
+    heartbeat,
+    record_interaction,
+    trace_session,
 )
-from backend import get_shared_game
+from game_logging import setup_logging
+from html_templates import get_html_cache_stats
 
 
 def main():
     """Main function to run the Streamlit app."""
 
+    setup_logging()
+
     st.title("Taboo Game")
+    trace_session()
+    heartbeat()
+    record_interaction()
 
     # Get the shared game instance for user interactions
     game = get_shared_game()
@@ -31,6 +46,14 @@ def main():
         st.write(game)
         st.write("Current Session State:")
         st.write(st.session_state)
+        st.write("Rendered HTML cache:")
+        st.write(get_html_cache_stats())
+        st.write("Room quotas:")
+        st.write(get_rooms().metrics())
+        st.write("Change propagation latency:")
+        st.write(get_latency_tracer().report())
+        if st.button("Export latency report"):
+            st.write(f"Saved to {get_latency_tracer().export()}")
 
     # Display auto-updating game state
     display_player_state()
@@ -47,19 +70,24 @@ def main():
 
         add_player(game)
 
-        if (
-            game.players
-            and len(
-                [player for player in game.players if player.role.value == "unassigned"]
-            )
-            == 0
-        ):
-            st.success("Game is ready to start! Waiting for players to start the game.")
+        if game.players:
+            readiness = game.check_teams()
+            if readiness:
+                st.success(
+                    "Game is ready to start! Waiting for players to start the game."
+                )
+            else:
+                st.caption(
+                    " ".join(violation.message for violation in readiness.violations)
+                )
 
     # Add game control buttons
     with st.sidebar:
         st.header("Game Controls")
         game_controls()
+        card_queue_controls()
+        display_room_chat()
+        display_leaderboard()
 
 
 if __name__ == "__main__":
@@ -1,14 +1,22 @@
 """This module defines the backend logic for the Taboo game."""
 
+import threading
+from collections import Counter, deque
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
-
-
-import streamlit as st
+from itertools import islice
+from typing import Callable, Iterable, Iterator
 
 MIN_PLAYERS = 4
 NUMBER_OF_TABOO_WORDS = 5
+MAX_QUEUED_CARDS = 5
+CHAT_CAPACITY = 200
+
+
+def normalize_word(word: str) -> str:
+    """Normalize a card word for comparisons."""
+    return " ".join(word.split()).lower()
 
 
 class Team(Enum):
@@ -29,6 +37,92 @@ class Role(Enum):
     UNASSIGNED = "unassigned"
 
 
+class Phase(Enum):
+    """Enum to represent the phases a game goes through."""
+
+    LOBBY = "lobby"
+    CARD_MAKING = "card_making"
+    ACTIVE_TURN = "active_turn"
+    TURN_END = "turn_end"
+    GAME_OVER = "game_over"
+
+
+class Stat(Enum):
+    """Enum to represent the achievements a player is credited for."""
+
+    CORRECT_GUESS = "correct_guesses"
+    SUCCESSFUL_HINT = "successful_hints"
+    CAUGHT_CHEAT = "caught_cheats"
+
+
+class Rule(Enum):
+    """Enum to represent the game rules an action can violate."""
+
+    MISSING_TEAM = "missing_team"
+    CARD_MAKER_COUNT = "card_maker_count"
+    LEADER_COUNT = "leader_count"
+    NO_CHECKER = "no_checker"
+    NO_GUESSER = "no_guesser"
+    CARD_MAKER_TEAM = "card_maker_team"
+    LEADER_TEAM = "leader_team"
+    TOO_FEW_PLAYERS = "too_few_players"
+    UNASSIGNED_TEAM = "unassigned_team"
+    UNASSIGNED_ROLE = "unassigned_role"
+    TOO_FEW_TABOO_WORDS = "too_few_taboo_words"
+    TOO_MANY_TABOO_WORDS = "too_many_taboo_words"
+    EMPTY_WORD = "empty_word"
+    TABOO_IS_CARD_WORD = "taboo_is_card_word"
+    DUPLICATE_CARD = "duplicate_card"
+    WORD_ALREADY_USED = "word_already_used"
+    CARD_ALREADY_MADE = "card_already_made"
+    CARD_QUEUE_FULL = "card_queue_full"
+    CARD_QUEUE_EMPTY = "card_queue_empty"
+    EMPTY_MESSAGE = "empty_message"
+    ROOM_FULL = "room_full"
+    INPUT_TOO_LONG = "input_too_long"
+    TURN_LIMIT = "turn_limit"
+    GAME_OVER = "game_over"
+
+
+@dataclass(frozen=True)
+class Violation:
+    """Data class to represent a broken game rule."""
+
+    rule: Rule
+    message: str
+    level: str = "error"
+
+
+@dataclass
+class Result:
+    """Data class to represent the outcome of a game action.
+
+    A result is truthy when no error level rule was broken, so callers that
+    only need a yes or no can keep using it in an if statement.
+    """
+
+    violations: list[Violation] = field(default_factory=list)
+    message: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """Check if the action succeeded."""
+        return not any(v.level == "error" for v in self.violations)
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+
+@dataclass(frozen=True)
+class Quotas:
+    """Data class to hold the resource limits of one room."""
+
+    max_players: int = 20
+    max_input_length: int = 100
+    max_turns: int = 100
+    max_messages: int = CHAT_CAPACITY
+
+
 @dataclass
 class Card:
     """Data class to represent a card in the game."""
@@ -38,19 +132,61 @@ class Card:
     created_at: datetime = field(default_factory=datetime.now)
 
     def __post_init__(self):
-        """Ensure taboo words are unique."""
-        self.taboo_words = list(set(self.taboo_words))
+        """Ensure taboo words are unique, keeping the first occurrence of each."""
+        self.word = self.word.strip().capitalize()
+        self.taboo_words = list(
+            dict.fromkeys(word.strip().capitalize() for word in self.taboo_words)
+        )
         if len(self.taboo_words) > NUMBER_OF_TABOO_WORDS:
             self.taboo_words = self.taboo_words[:NUMBER_OF_TABOO_WORDS]
 
+    def check(self) -> list[Violation]:
+        """Check that the card has enough taboo words."""
         if len(self.taboo_words) < NUMBER_OF_TABOO_WORDS:
-            st.error(
-                f"Card '{self.word}' has less than {NUMBER_OF_TABOO_WORDS} taboo words. "
-                "Please ensure it has enough taboo words."
+            return [
+                Violation(
+                    Rule.TOO_FEW_TABOO_WORDS,
+                    f"Card '{self.word}' has less than {NUMBER_OF_TABOO_WORDS} "
+                    "taboo words. Please ensure it has enough taboo words.",
+                    "warning",
+                )
+            ]
+        return []
+
+
+def check_card_entry(word: str, taboo_words: list[str]) -> list[Violation]:
+    """Check a raw card entry strictly, before Card normalizes it."""
+    violations = []
+    key = normalize_word(word)
+    if not key:
+        violations.append(Violation(Rule.EMPTY_WORD, "The card has no word."))
+
+    taboo_keys = {normalize_word(w) for w in taboo_words} - {""}
+    if key and key in taboo_keys:
+        violations.append(
+            Violation(
+                Rule.TABOO_IS_CARD_WORD,
+                f"Card '{word}' lists its own word as a taboo word.",
             )
+        )
 
-        self.word = self.word.strip().capitalize()
-        self.taboo_words = [word.strip().capitalize() for word in self.taboo_words]
+    if len(taboo_keys) < NUMBER_OF_TABOO_WORDS:
+        violations.append(
+            Violation(
+                Rule.TOO_FEW_TABOO_WORDS,
+                f"Card '{word}' has {len(taboo_keys)} distinct taboo words, "
+                f"expected {NUMBER_OF_TABOO_WORDS}.",
+            )
+        )
+    elif len(taboo_keys) > NUMBER_OF_TABOO_WORDS:
+        violations.append(
+            Violation(
+                Rule.TOO_MANY_TABOO_WORDS,
+                f"Card '{word}' has {len(taboo_keys)} distinct taboo words, "
+                f"expected {NUMBER_OF_TABOO_WORDS}.",
+            )
+        )
+    return violations
 
 
 @dataclass
@@ -63,6 +199,7 @@ class Player:
 
     is_cheating: bool = field(default=False)
     score: int = field(default=0)
+    is_idle: bool = field(default=False, compare=False)
 
     @property
     def is_leader(self) -> bool:
@@ -99,6 +236,7 @@ class Turn:
     max_hints: int = 5
 
     end_turn: bool = False
+    ended_at: datetime | None = None
 
     score: tuple[int, int] = (0, 0)  # (team_a_score, team_b_score)
 
@@ -132,6 +270,21 @@ class Turn:
             not self.successfully_guessed and len(self.guesses) >= self.max_guesses
         ) or self.tabooed
 
+    def credits(self, claimed_by: Player | None = None) -> list[tuple[Player, Stat]]:
+        """List the players to credit for how the turn ended."""
+        if self.successfully_guessed:
+            credits = []
+            if self.guessers[-1] is not None:
+                credits.append((self.guessers[-1], Stat.CORRECT_GUESS))
+            hinters = {id(p): p for p in self.hinters if p is not None}
+            credits.extend((p, Stat.SUCCESSFUL_HINT) for p in hinters.values())
+            return credits
+
+        if claimed_by is not None and not self.tabooed:
+            return [(claimed_by, Stat.CAUGHT_CHEAT)]
+
+        return []
+
     @property
     def is_ongoing(self) -> bool:
         """Check if the turn is ongoing."""
@@ -148,18 +301,48 @@ class Message:
 
     sender: Player
     content: str
+    id: int = 0
 
 
 @dataclass
 class Chat:
-    """Data class to represent the game chat."""
+    """Data class to represent the game chat.
+
+    Only the newest capacity messages are kept. Every message gets an id one
+    higher than the one before, so readers remember the last id they saw and
+    fetch only what arrived after it.
+    """
 
-    messages: list[Message] = field(default_factory=list)
+    messages: deque[Message] = field(default_factory=deque)
+    capacity: int = CHAT_CAPACITY
+    next_id: int = 1
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
-    def add_message(self, sender: Player, content: str):
-        """Add a message to the chat."""
-        message = Message(sender=sender, content=content)
-        self.messages.append(message)
+    def __post_init__(self):
+        """Keep only the newest messages and number any that have no id."""
+        self.messages = deque(self.messages, maxlen=self.capacity)
+        for message in self.messages:
+            if not message.id:
+                message.id = self.next_id
+            self.next_id = max(self.next_id, message.id + 1)
+
+    def add_message(self, sender: Player, content: str) -> Message:
+        """Add a message to the chat, dropping the oldest one when full."""
+        with self.lock:
+            message = Message(sender=sender, content=content, id=self.next_id)
+            self.next_id += 1
+            self.messages.append(message)
+        return message
+
+    def messages_after(self, cursor: int) -> list[Message]:
+        """Return the messages with an id above cursor, oldest first."""
+        with self.lock:
+            count = min(self.next_id - 1 - cursor, len(self.messages))
+            if count <= 0:
+                return []
+            return list(islice(reversed(self.messages), count))[::-1]
 
 
 @dataclass
@@ -174,28 +357,257 @@ class Game:
     turns: list[Turn] = field(default_factory=list)
     chat: Chat = field(default_factory=Chat)
 
-    def add_player(self, player: Player):
-        """Add a player to the game."""
-        self.players.append(player)
+    quotas: Quotas = field(default_factory=Quotas, compare=False)
+
+    # When set, players joining are put on the smaller team and roles are
+    # handed out by assign_roles at the start of every turn.
+    auto_assign: bool = False
+
+    # Number of players per team, per role and per (team, role), kept current by
+    # add_player, assign and next_turn so readiness checks never scan the roster.
+    # Idle players are left out, so they never block the readiness checks.
+    team_counts: Counter = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+    role_counts: Counter = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+    assignments: Counter = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+
+    # Number of turns each (player name, role) pair was started with, used to
+    # rotate the leader and card maker fairly.
+    role_history: Counter = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+
+    # Cards each team prepared for its upcoming card making turns. next_turn
+    # starts the turn with the checking team's next card when there is one.
+    card_queues: dict[Team, deque[Card]] = field(
+        default_factory=lambda: {Team.A: deque(), Team.B: deque()},
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    # Normalized words of every card made in this game. Rooms playing from the
+    # same deck can pass in one shared set so a word is used once across them.
+    used_words: set[str] = field(default_factory=set, repr=False, compare=False)
+
+    # Incremented by every method that changes the game, so readers can tell
+    # whether anything happened since they last looked.
+    revision: int = field(default=0, compare=False)
+
+    # Number of actions rejected per quota rule, for metrics.
+    quota_rejections: Counter = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+
+    # Summary of the finished game, set once by the report module.
+    report: object | None = field(default=None, init=False, repr=False, compare=False)
+
+    # Callables invoked with the game after every change, e.g. for tracing.
+    listeners: list[Callable[["Game"], None]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Count the team and role assignments and index the cards already made."""
+        for player in self.players:
+            self.count(player, 1)
+        self.used_words.update(normalize_word(turn.card.word) for turn in self.turns)
+        if self.chat.capacity != self.quotas.max_messages:
+            self.chat = Chat(self.chat.messages, capacity=self.quotas.max_messages)
+
+    def touch(self):
+        """Mark the game as changed."""
+        self.revision += 1
+        for listener in self.listeners:
+            listener(self)
+
+    def count(self, player: Player, delta: int):
+        """Add delta to the assignment counts of a player's team and role."""
+        if player.is_idle:
+            return
+        self.team_counts[player.team] += delta
+        self.role_counts[player.role] += delta
+        self.assignments[(player.team, player.role)] += delta
+
+    def quota_violation(self, rule: Rule, message: str) -> list[Violation]:
+        """Count a rejection by a quota and return its violation."""
+        self.quota_rejections[rule.value] += 1
+        return [Violation(rule, message)]
+
+    def check_input(self, *texts: str) -> list[Violation]:
+        """Check that player input fits the room's length quota."""
+        limit = self.quotas.max_input_length
+        if any(len(text) > limit for text in texts):
+            return self.quota_violation(
+                Rule.INPUT_TOO_LONG, f"Input is limited to {limit} characters."
+            )
+        return []
+
+    def quota_usage(self) -> dict:
+        """Report how much of each quota the room uses and how often it said no."""
+        return {
+            "players": [len(self.players), self.quotas.max_players],
+            "turns": [len(self.turns), self.quotas.max_turns],
+            "messages": [len(self.chat.messages), self.quotas.max_messages],
+            "rejections": dict(self.quota_rejections),
+        }
+
+    def add_player(self, player: Player) -> Result:
+        """Add a player to the game, placing them automatically if enabled."""
+        if len(self.players) >= self.quotas.max_players:
+            return Result(
+                self.quota_violation(
+                    Rule.ROOM_FULL,
+                    f"The room is full ({self.quotas.max_players} players).",
+                )
+            )
+        violations = self.check_input(player.name)
+        if violations:
+            return Result(violations)
 
-    def next_turn(self):
+        self.players.append(player)
+        self.count(player, 1)
+        if not self.auto_assign:
+            self.touch()
+        elif self.ongoing:
+            # Join the turn in progress without taking over a leading role.
+            team = self.smaller_team()
+            role = Role.GUESSER if team == self.guessing_team else Role.CHECKER
+            self.assign(player, team=team, role=role)
+        else:
+            self.assign_roles()
+        return Result()
+
+    def remove_player(self, player: Player):
+        """Remove a player from the game, handing out roles again if enabled."""
+        if not any(p is player for p in self.players):
+            return
+        self.players = [p for p in self.players if p is not player]
+        self.count(player, -1)
+        if self.auto_assign and not self.ongoing:
+            self.assign_roles()
+        else:
+            self.touch()
+
+    def set_idle(self, player: Player, idle: bool):
+        """Mark a player as idle or back again, handing out roles again if enabled.
+
+        Idle players leave the assignment counts, so an idle leader or card
+        maker is replaced before the next turn when roles are automatic.
+        """
+        if player.is_idle == idle:
+            return
+        if idle:
+            self.count(player, -1)
+        player.is_idle = idle
+        if not idle:
+            self.count(player, 1)
+        if self.auto_assign and not self.ongoing:
+            self.assign_roles()
+        else:
+            self.touch()
+
+    def smaller_team(self) -> Team:
+        """Return the team with fewer players, Team A on a tie."""
+        if self.team_counts[Team.B] < self.team_counts[Team.A]:
+            return Team.B
+        return Team.A
+
+    def set_auto_assign(self, enabled: bool) -> Result:
+        """Turn automatic team and role assignment on or off."""
+        self.auto_assign = enabled
+        if enabled and not self.ongoing:
+            return self.assign_roles()
+        self.touch()
+        return Result()
+
+    def assign_roles(self) -> Result:
+        """Place unassigned players on teams and hand out roles for the turn.
+
+        The leader and card maker are the players on their team who started
+        the fewest turns in that role, earliest joined first, so both roles
+        go round each team in turn. Idle players are never picked for them.
+        Everyone else guesses or checks.
+        """
+        for player in self.players:
+            if player.team == Team.U:
+                self.count(player, -1)
+                player.team = self.smaller_team()
+                self.count(player, 1)
+
+        for team, lead_role, other_role in (
+            (self.guessing_team, Role.LEADER, Role.GUESSER),
+            (self.checking_team, Role.CARD_MAKER, Role.CHECKER),
+        ):
+            members = [p for p in self.players if p.team == team]
+            if not members:
+                continue
+
+            active = [p for p in members if not p.is_idle]
+            lead = (
+                min(active, key=lambda p: self.role_history[(p.name, lead_role)])
+                if active
+                else None
+            )
+            for player in members:
+                role = lead_role if player is lead else other_role
+                if player.role != role:
+                    self.count(player, -1)
+                    player.role = role
+                    self.count(player, 1)
+
+        self.touch()
+        return self.check_teams()
+
+    def assign(
+        self, player: Player, team: Team | None = None, role: Role | None = None
+    ):
+        """Change the team and/or role of a player."""
+        self.count(player, -1)
+        if team is not None:
+            player.team = team
+        if role is not None:
+            player.role = role
+        self.count(player, 1)
+        self.touch()
+
+    def next_turn(self) -> Result:
         """Advance to the next turn in the game."""
         self.current_turn += 1
-        if self.current_turn >= self.max_turns:
-            st.warning("Game over! No more turns left.")
-            return False
+        if self.current_turn > self.max_turns:
+            self.touch()
+            return Result([Violation(Rule.GAME_OVER, "Game over! No more turns left.")])
 
         if (self.current_turn - 1) % 2 == 0:
             self.current_round += 1
             if self.current_round > self.max_rounds:
-                st.warning("Game over! Maximum rounds reached.")
-                return False
+                self.touch()
+                return Result(
+                    [Violation(Rule.GAME_OVER, "Game over! Maximum rounds reached.")]
+                )
 
         self.ongoing = False
         for player in self.players:
             player.role = Role.UNASSIGNED
+        self.role_counts = Counter({Role.UNASSIGNED: self.team_counts.total()})
+        self.assignments = Counter(
+            {(team, Role.UNASSIGNED): count for team, count in self.team_counts.items()}
+        )
+        self.touch()
+        if self.auto_assign:
+            self.assign_roles()
 
-        return True
+        if self.card_queues[self.checking_team]:
+            self.play_queued_card()
+            if self.auto_assign:
+                self.start_game()
+
+        return Result()
 
     @property
     def score(self) -> tuple[int, int]:
@@ -213,6 +625,24 @@ class Game:
         """Calculate the maximum number of turns based on the number of players."""
         return self.max_rounds * 2
 
+    @property
+    def is_over(self) -> bool:
+        """Check if every turn of the game has been played."""
+        return self.current_turn > self.max_turns
+
+    @property
+    def phase(self) -> Phase:
+        """Determine which phase the game is in."""
+        if self.is_over:
+            return Phase.GAME_OVER
+        if not self.ongoing:
+            return Phase.LOBBY
+        if len(self.turns) < self.current_turn:
+            return Phase.CARD_MAKING
+        if self.turns[-1].end_turn:
+            return Phase.TURN_END
+        return Phase.ACTIVE_TURN
+
     @property
     def checking_team(self) -> Team:
         """Determine which team is currently checking."""
@@ -223,80 +653,257 @@ class Game:
         """Determine which team is currently guessing."""
         return Team.B if self.current_turn % 2 == 0 else Team.A
 
-    def check_teams(self):
-        """Check if both teams have players assigned."""
-        team_a_players = [p for p in self.players if p.team == Team.A]
-        team_b_players = [p for p in self.players if p.team == Team.B]
-
-        if not team_a_players or not team_b_players:
+    def check_teams(self) -> Result:
+        """Check that teams and roles are ready, reporting every broken rule."""
+        violations = []
 
-            st.error("Both teams must have players assigned to start the game.")
-            return False
+        if not self.team_counts[Team.A] or not self.team_counts[Team.B]:
+            violations.append(
+                Violation(
+                    Rule.MISSING_TEAM,
+                    "Both teams must have players assigned to start the game.",
+                )
+            )
 
-        card_makers = [p for p in self.players if p.role == Role.CARD_MAKER]
-        if len(card_makers) != 1:
-            st.error("There must be exactly one card maker assigned.")
-            return False
+        if self.role_counts[Role.CARD_MAKER] != 1:
+            violations.append(
+                Violation(
+                    Rule.CARD_MAKER_COUNT,
+                    "There must be exactly one card maker assigned.",
+                )
+            )
+        elif not self.assignments[(self.checking_team, Role.CARD_MAKER)]:
+            violations.append(
+                Violation(
+                    Rule.CARD_MAKER_TEAM,
+                    f"Card maker must be on {self.checking_team.value}.",
+                )
+            )
 
-        leaders = [p for p in self.players if p.role == Role.LEADER]
-        if len(leaders) != 1:
-            st.error("There must be exactly one leader assigned.")
-            return False
+        if self.role_counts[Role.LEADER] != 1:
+            violations.append(
+                Violation(
+                    Rule.LEADER_COUNT, "There must be exactly one leader assigned."
+                )
+            )
+        elif not self.assignments[(self.guessing_team, Role.LEADER)]:
+            violations.append(
+                Violation(
+                    Rule.LEADER_TEAM, f"Leader must be on {self.guessing_team.value}."
+                )
+            )
 
-        checkers = [p for p in self.players if p.role == Role.CHECKER]
-        if len(checkers) < 1:
-            st.error("At least one checker must be assigned.")
-            return False
+        if not self.role_counts[Role.CHECKER]:
+            violations.append(
+                Violation(Rule.NO_CHECKER, "At least one checker must be assigned.")
+            )
 
-        guessers = [p for p in self.players if p.role == Role.GUESSER]
-        if len(guessers) < 1:
-            st.error("At least one guesser must be assigned.")
-            return False
+        if not self.role_counts[Role.GUESSER]:
+            violations.append(
+                Violation(Rule.NO_GUESSER, "At least one guesser must be assigned.")
+            )
 
-        card_maker = card_makers[0]
-        if card_maker.team != self.checking_team:
-            st.error(f"Card maker must be on {self.checking_team.value}.")
-            return False
+        if self.team_counts.total() < MIN_PLAYERS:
+            violations.append(
+                Violation(
+                    Rule.TOO_FEW_PLAYERS,
+                    f"At least {MIN_PLAYERS} players are required to start the game!",
+                )
+            )
 
-        leader = leaders[0]
-        if leader.team != self.guessing_team:
-            st.error(f"Leader must be on {self.guessing_team.value}.")
-            return False
+        if self.team_counts[Team.U]:
+            violations.append(
+                Violation(
+                    Rule.UNASSIGNED_TEAM,
+                    "All players must be assigned to a team before starting the game.",
+                )
+            )
 
-        if len(self.players) < MIN_PLAYERS:
-            st.error(f"At least {MIN_PLAYERS} players are required to start the game!")
-            return False
+        if self.role_counts[Role.UNASSIGNED]:
+            violations.append(
+                Violation(
+                    Rule.UNASSIGNED_ROLE,
+                    "All players must have a role assigned before starting the game.",
+                )
+            )
 
-        unassigned_players = [p for p in self.players if p.team == Team.U]
-        if unassigned_players:
-            st.error("All players must be assigned to a team before starting the game.")
-            return False
+        return Result(violations)
 
-        unassigned_roles = [p for p in self.players if p.role == Role.UNASSIGNED]
-        if unassigned_roles:
-            st.error("All players must have a role assigned before starting the game.")
-            return False
-
-        return True
+    @property
+    def is_ready(self) -> bool:
+        """Check if the turn can start."""
+        return self.check_teams().ok
 
-    def start_game(self):
+    def start_game(self) -> Result:
         """Start the game if all conditions are met."""
-        if not self.check_teams():
-            st.error("Cannot start the game. Please check team and role assignments.")
-            return False
+        result = self.check_teams()
+        if not result:
+            result.message = (
+                "Cannot start the game. Please check team and role assignments."
+            )
+            return result
 
         self.ongoing = True
-        st.success("Game started successfully!")
-        return True
-
-    def make_card(self, word: str, taboo_words: list[str]):
+        for player in self.players:
+            if player.role in (Role.LEADER, Role.CARD_MAKER):
+                self.role_history[(player.name, player.role)] += 1
+        self.touch()
+        return Result(message="Game started successfully!")
+
+    def is_word_used(self, word: str) -> bool:
+        """Check if a card has already been made for a word."""
+        return normalize_word(word) in self.used_words
+
+    def unused_words(self, words: Iterable[str]) -> Iterator[str]:
+        """Yield the words from a card source that have not been used yet."""
+        used_words = self.used_words
+        return (word for word in words if normalize_word(word) not in used_words)
+
+    def check_word(self, word: str, taboo_words: list[str]) -> list[Violation]:
+        """Check that a new card fits the quotas and its word is still unused."""
+        violations = self.check_input(word, *taboo_words)
+        if violations:
+            return violations
+        if len(self.turns) >= self.quotas.max_turns:
+            return self.quota_violation(
+                Rule.TURN_LIMIT,
+                f"The room has reached its limit of {self.quotas.max_turns} turns.",
+            )
+        if normalize_word(word) in self.used_words:
+            return [
+                Violation(
+                    Rule.WORD_ALREADY_USED,
+                    f"'{word.strip()}' has already been used in this game.",
+                )
+            ]
+        return []
+
+    def make_card(self, word: str, taboo_words: list[str]) -> Result:
         """Create a new card and add it to the game."""
+        violations = self.check_word(word, taboo_words)
+        if violations:
+            return Result(violations)
+
         card = Card(word=word, taboo_words=taboo_words)
         turn = Turn(card=card)
         self.turns.append(turn)
+        self.used_words.add(normalize_word(word))
+        self.touch()
+        return Result(card.check())
+
+    def queue_card(self, team: Team, word: str, taboo_words: list[str]) -> Result:
+        """Prepare a card for one of a team's upcoming card making turns."""
+        queue = self.card_queues.get(team)
+        if queue is None:
+            return Result(
+                [Violation(Rule.UNASSIGNED_TEAM, "Join a team to prepare cards.")]
+            )
+        if len(queue) >= MAX_QUEUED_CARDS:
+            return Result(
+                [
+                    Violation(
+                        Rule.CARD_QUEUE_FULL,
+                        f"{team.value} already has {MAX_QUEUED_CARDS} cards ready.",
+                    )
+                ]
+            )
 
+        violations = self.check_word(word, taboo_words)
+        if violations:
+            return Result(violations)
 
-@st.cache_resource
-def get_shared_game():
-    """Get or create a shared game instance that persists across all users and sessions."""
-    return Game()
+        card = Card(word=word, taboo_words=taboo_words)
+        queue.append(card)
+        self.used_words.add(normalize_word(word))
+        self.touch()
+        return Result(card.check())
+
+    def play_queued_card(self) -> Result:
+        """Give the current turn the checking team's next prepared card."""
+        if len(self.turns) >= self.current_turn:
+            return Result(
+                [
+                    Violation(
+                        Rule.CARD_ALREADY_MADE,
+                        "A card has already been made for this turn.",
+                    )
+                ]
+            )
+
+        queue = self.card_queues[self.checking_team]
+        if not queue:
+            return Result(
+                [
+                    Violation(
+                        Rule.CARD_QUEUE_EMPTY,
+                        f"{self.checking_team.value} has no cards ready.",
+                    )
+                ]
+            )
+
+        self.turns.append(Turn(card=queue.popleft()))
+        self.touch()
+        return Result()
+
+    def send_message(self, player: Player, content: str) -> Result:
+        """Post a message to the room chat."""
+        content = content.strip()
+        if not content:
+            return Result([Violation(Rule.EMPTY_MESSAGE, "The message is empty.")])
+        violations = self.check_input(content)
+        if violations:
+            return Result(violations)
+
+        self.chat.add_message(player, content)
+        self.touch()
+        return Result()
+
+    def add_hint(self, hint: str, player: Player) -> Result:
+        """Add a hint to the current turn."""
+        violations = self.check_input(hint.strip())
+        if violations:
+            return Result(violations)
+
+        self.turns[-1].add_hint(hint, player)
+        self.touch()
+        return Result()
+
+    def add_guess(self, guess: str, player: Player) -> Result:
+        """Add a guess to the current turn."""
+        violations = self.check_input(guess.strip())
+        if violations:
+            return Result(violations)
+
+        self.turns[-1].add_guess(guess, player)
+        self.touch()
+        return Result()
+
+    def end_turn(self, score: int, claimed_by: Player | None = None) -> bool:
+        """End the current turn, scoring -1 for cheating, 0 for none or 1 for success.
+
+        Players credited for the outcome, including the checker who claimed
+        cheating if any, have their score increased by one. Returns False and
+        changes nothing if there is no turn, the turn has already ended or the
+        score is invalid, so a turn is never credited twice.
+        """
+        if not self.turns or self.turns[-1].end_turn:
+            return False
+
+        if score == 0:
+            self.turns[-1].score = (0, 0)
+
+        elif score == 1:
+            self.turns[-1].score = (1, 0) if self.guessing_team == Team.A else (0, 1)
+
+        elif score == -1:
+            self.turns[-1].score = (0, 1) if self.guessing_team == Team.A else (1, 0)
+
+        else:
+            return False
+
+        self.turns[-1].end_turn = True
+        self.turns[-1].ended_at = datetime.now()
+        for player, _ in self.turns[-1].credits(claimed_by):
+            player.score += 1
+        self.touch()
+        return True
@@ -1,11 +1,35 @@
 """This module contains components for the Taboo game."""
 
+import functools
 import time
+import uuid
+from collections import deque
 
 import streamlit as st
 
-from backend import Card, get_shared_game, Player, Team, Role, Game, MIN_PLAYERS
+from backend import (
+    Card,
+    Player,
+    Team,
+    Role,
+    Game,
+    Phase,
+    Result,
+    MIN_PLAYERS,
+    MAX_QUEUED_CARDS,
+    NUMBER_OF_TABOO_WORDS,
+)
 from css_loader import load_css
+from dictionary import WordIndex
+from game_logging import get_logger
+from leaderboard import Leaderboard
+from presence import Presence
+from report import ReportWorker
+from rooms import Rooms
+from ratelimit import RateLimiter
+from refresh import refresh_interval
+from snapshots import GameView, SnapshotPublisher, TurnView
+from tracing import LatencyTracer, current_session
 from html_templates import (
     get_player_board_open,
     get_player_board_close,
@@ -20,8 +44,186 @@ from html_templates import (
     get_taboo_card_html,
     get_taboo_card_hidden_html,
     get_scorecard_html,
+    get_game_over_html,
 )
 
+logger = get_logger("components")
+
+DEFAULT_ROOM = "default"
+
+# Number of chat messages each session keeps on screen.
+CHAT_DISPLAY_SIZE = 50
+
+
+@st.cache_resource
+def get_rooms():
+    """Get the registry of the rooms hosted by this server process."""
+    return Rooms()
+
+
+@st.cache_resource
+def get_shared_game():
+    """Get or create a shared game instance that persists across all users and sessions."""
+    return get_rooms().open(DEFAULT_ROOM)
+
+
+@st.cache_resource
+def get_rate_limiter():
+    """Get the rate limiter shared by all users and sessions."""
+    return RateLimiter()
+
+
+@st.cache_resource
+def get_word_index():
+    """Load the card maker dictionary once for all users and sessions."""
+    return WordIndex.load()
+
+
+@st.cache_resource
+def get_leaderboard():
+    """Load the persistent leaderboard once for all users and sessions."""
+    return Leaderboard.load()
+
+
+@st.cache_resource
+def get_latency_tracer():
+    """Get the tracer recording change propagation in the shared game."""
+    tracer = LatencyTracer()
+    tracer.attach(get_shared_game())
+    return tracer
+
+
+@st.cache_resource
+def get_snapshot_publisher():
+    """Get the publisher of immutable snapshots of the shared game."""
+    publisher = SnapshotPublisher()
+    publisher.attach(get_shared_game())
+    return publisher
+
+
+@st.cache_resource
+def get_report_worker():
+    """Get the background worker that builds end-of-game reports."""
+    return ReportWorker()
+
+
+@st.cache_resource
+def get_presence():
+    """Get the table of open sessions in the shared game."""
+    return Presence()
+
+
+def get_game_view() -> GameView:
+    """Get the latest snapshot of the shared game for rendering."""
+    return get_snapshot_publisher().current
+
+
+def trace_session():
+    """Attribute game changes made in this script run to the current session."""
+    current_session.set(get_session_id())
+
+
+def heartbeat():
+    """Record that this session is open and expire sessions that are not."""
+    presence = get_presence()
+    presence.heartbeat(get_session_id(), st.session_state.get("player_name"))
+    for session_id in presence.maybe_sweep(get_shared_game()):
+        get_latency_tracer().forget(session_id)
+
+
+def get_session_id() -> str:
+    """Get a stable identifier for the current browser session."""
+    if "session_id" not in st.session_state:
+        st.session_state["session_id"] = uuid.uuid4().hex
+    return st.session_state["session_id"]
+
+
+def record_interaction():
+    """Remember that the user interacted with this session.
+
+    Every full script run counts, except the reruns the refresh policy
+    triggers itself to register a new fragment interval.
+    """
+    if not st.session_state.pop("policy_rerun", False):
+        st.session_state["interacted_at"] = time.monotonic()
+
+
+def action_allowed(action: str) -> bool:
+    """Check the rate limits for an action before it touches the game."""
+    if get_rate_limiter().allow(action, get_session_id()):
+        st.session_state["interacted_at"] = time.monotonic()
+        return True
+
+    st.toast("Too many actions, please slow down.")
+    return False
+
+
+def session_refresh_interval(scale: float = 1.0) -> float:
+    """Pick the rerun interval for the current session from the refresh policy."""
+    game = get_shared_game()
+
+    now = time.monotonic()
+    idle_seconds = now - st.session_state.setdefault("interacted_at", now)
+
+    player_name = st.session_state.get("player_name")
+    player = next((p for p in game.players if p.name == player_name), None)
+    role = player.role if player else None
+
+    return refresh_interval(game.phase, role, idle_seconds, scale)
+
+
+def adaptive_fragment(scale: float = 1.0):
+    """Decorate a fragment whose rerun interval follows the refresh policy.
+
+    Streamlit only picks up a fragment's interval when the whole app runs, so
+    when the policy asks for a different interval the fragment triggers one
+    full rerun to register it.
+    """
+
+    def decorator(func):
+        key = f"refresh_interval_{func.__name__}"
+
+        @functools.wraps(func)
+        def body(*args, **kwargs):
+            if session_refresh_interval(scale) != st.session_state.get(key):
+                st.session_state["policy_rerun"] = True
+                st.rerun()
+
+            trace_session()
+            heartbeat()
+            get_latency_tracer().observe(
+                get_session_id(),
+                func.__name__,
+                get_game_view().revision,
+                st.session_state[key],
+            )
+            return func(*args, **kwargs)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            st.session_state[key] = session_refresh_interval(scale)
+            fragment = st.fragment(body, run_every=st.session_state[key])
+            return fragment(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def show_result(result: Result):
+    """Render the violations and message of a backend result."""
+    for violation in result.violations:
+        if violation.level == "warning":
+            st.warning(violation.message)
+        else:
+            st.error(violation.message)
+
+    if result.message:
+        if result.ok:
+            st.success(result.message)
+        else:
+            st.error(result.message)
+
 
 def add_player(game: Game):
     """Add a new player to the game."""
@@ -35,6 +237,9 @@ def add_player(game: Game):
             player = player[0]
             st.write(f"Current Player: {player.name} ({player.role.value})")
         if not player:
+            # Removed while the session was away, e.g. for being idle
+            st.info("You are no longer in the game. Please join again.")
+            del st.session_state["player_name"]
             return
 
         if game.ongoing:
@@ -57,15 +262,21 @@ def add_player(game: Game):
             )
 
             if st.button("Update Team"):
-                player.team = Team.A if team_choice == "Team A" else Team.B
-
                 # Reset role when team changes
-                player.role = Role.UNASSIGNED
+                game.assign(
+                    player,
+                    team=Team.A if team_choice == "Team A" else Team.B,
+                    role=Role.UNASSIGNED,
+                )
+                if game.auto_assign:
+                    game.assign_roles()
                 st.success(f"Team updated to {team_choice}!")
                 st.rerun()
 
         # Role selection (always available if team is assigned)
-        if player.team != Team.U:
+        if game.auto_assign:
+            st.info("Teams and roles are assigned automatically every turn.")
+        elif player.team != Team.U:
             st.subheader("Role Selection")
 
             role_options = (
@@ -86,7 +297,7 @@ def add_player(game: Game):
             )
 
             if st.button("Update Role"):
-                player.role = Role(role_choice)
+                game.assign(player, role=Role(role_choice))
                 st.success(f"Role updated to {role_choice}!")
                 st.rerun()
         else:
@@ -96,11 +307,15 @@ def add_player(game: Game):
 
     # New player joining
     st.subheader("Join the Game")
-    name = st.text_input("Enter your name:")
-    if st.button("Join Game"):
+    name = st.text_input("Enter your name:", max_chars=game.quotas.max_input_length)
+    if st.button("Join Game") and action_allowed("join"):
         if name and name not in [p.name for p in game.players]:
             new_player = Player(name=name)
-            game.add_player(new_player)
+            result = game.add_player(new_player)
+            if not result:
+                show_result(result)
+                return
+            logger.info("Player joined", extra={"player": name})
             st.success(f"{name} has joined!")
             st.session_state["player_name"] = name
             st.rerun()
@@ -117,7 +332,7 @@ def add_player(game: Game):
 
 def display_player_state():
     """Display the current game state with auto-refresh every 2 seconds."""
-    game = get_shared_game()
+    game = get_game_view()
 
     # Load external CSS
     load_css("styles.css")
@@ -125,16 +340,18 @@ def display_player_state():
     if game.ongoing:
         # Show compact version in sidebar when game is ongoing
         with st.sidebar:
-            display_compact_player_state(game)
+            display_compact_player_state()
         return
 
     # Show full version in main area when game is not ongoing
-    display_full_player_state(game)
+    display_full_player_state()
 
 
-@st.fragment(run_every=2)
-def display_compact_player_state(game):
+@adaptive_fragment(scale=2)
+def display_compact_player_state():
     """Display a compact version of player state for the sidebar during gameplay."""
+    game = get_game_view()
+
     st.markdown("### 👥 Players")
 
     # Simple game stats
@@ -161,7 +378,8 @@ def display_compact_player_state(game):
             current_marker = (
                 "🫵 " if st.session_state.get("player_name") == player.name else ""
             )
-            st.markdown(f"- {current_marker}{role_emoji} {player.name}")
+            idle_marker = " 💤" if player.is_idle else ""
+            st.markdown(f"- {current_marker}{role_emoji} {player.name}{idle_marker}")
 
     if team_b_players:
         st.markdown("**🔵 Team B**")
@@ -175,12 +393,15 @@ def display_compact_player_state(game):
             current_marker = (
                 "🫵 " if st.session_state.get("player_name") == player.name else ""
             )
-            st.markdown(f"- {current_marker}{role_emoji} {player.name}")
+            idle_marker = " 💤" if player.is_idle else ""
+            st.markdown(f"- {current_marker}{role_emoji} {player.name}{idle_marker}")
 
 
-@st.fragment(run_every=2)
-def display_full_player_state(game: Game):
+@adaptive_fragment(scale=2)
+def display_full_player_state():
     """Display the full player state for the main area during setup."""
+    game = get_game_view()
+
     # Game statistics in a fancy card
     st.markdown(get_player_board_open(), unsafe_allow_html=True)
 
@@ -213,7 +434,7 @@ def display_full_player_state(game: Game):
                         unsafe_allow_html=True,
                     )
                 else:
-                    st.write(f"**{player.name}**")
+                    st.write(f"**{player.name}**{' 💤' if player.is_idle else ''}")
 
             with col2:
                 # Team assignment
@@ -247,35 +468,40 @@ def display_full_player_state(game: Game):
     st.markdown(get_player_board_close(), unsafe_allow_html=True)
 
 
-@st.fragment(run_every=1)
+@adaptive_fragment()
 def display_main_interface():
     """Display the main interface for the Taboo game."""
 
     game = get_shared_game()
+    view = get_game_view()
 
     # Display fancy scorecards at the top when game is ongoing
-    if game.ongoing:
+    if view.ongoing:
         display_scorecards()
 
+    if view.phase == Phase.GAME_OVER:
+        display_game_over()
+        return
+
     st.markdown(
-        f"#### Turn {(game.current_turn - 1) % 2 + 1} of Round {game.current_round}"
+        f"#### Turn {(view.current_turn - 1) % 2 + 1} of Round {view.current_round}"
     )
 
-    if game.turns and len(game.turns) == game.current_turn and game.turns[-1].end_turn:
+    if view.turn and view.turn.end_turn:
 
-        if game.turns[-1].score == (0, 0):
+        if view.turn.score == (0, 0):
             st.info("No score this turn. Waiting for next turn.")
 
-        elif game.turns[-1].score[0] > 0 or game.turns[-1].score[1] > 0:
+        elif view.turn.score[0] > 0 or view.turn.score[1] > 0:
             st.success(
-                f"Turn ended with score: Team A - {game.turns[-1].score[0]}, Team B - {game.turns[-1].score[1]}"
+                f"Turn ended with score: Team A - {view.turn.score[0]}, Team B - {view.turn.score[1]}"
             )
 
         else:
             st.error("Turn ended with negative score. Please check the game state.")
 
         st.markdown("### Total Score")
-        team_a_score, team_b_score = game.score
+        team_a_score, team_b_score = view.score
         st.markdown(f"**Team A:** {team_a_score} - **Team B:** {team_b_score}")
 
         st.markdown("### Chat Boxes")
@@ -283,14 +509,19 @@ def display_main_interface():
         chat_boxes()
 
         if st.button("Next Turn", key="next_turn_button"):
-            if game.next_turn():
+            result = game.next_turn()
+            logger.info(
+                "Next turn",
+                extra={"turn": game.current_turn, "game_over": not result.ok},
+            )
+            show_result(result)
+            if result:
                 st.success("Turn ended. Moving to next turn.")
-                time.sleep(2)
-                st.rerun()
             else:
+                get_report_worker().submit(game)
                 st.error("Game over or no more turns left.")
-                time.sleep(2)
-                st.rerun()
+            time.sleep(2)
+            st.rerun()
 
         return
 
@@ -327,7 +558,7 @@ def display_main_interface():
         st.rerun()
 
 
-@st.fragment(run_every=1)
+@adaptive_fragment()
 def game_controls():
     """Display game control buttons for refresh, start, and reset."""
     game = get_shared_game()
@@ -335,6 +566,14 @@ def game_controls():
     # Add buttons for game management
 
     if not game.ongoing:
+        auto_assign = st.checkbox(
+            "Assign teams and roles automatically", value=game.auto_assign
+        )
+        if auto_assign != game.auto_assign:
+            game.set_auto_assign(auto_assign)
+            logger.info("Auto assignment changed", extra={"enabled": auto_assign})
+            st.rerun()
+
         if st.button("🎮 Start Turn"):
             if len(game.players) < MIN_PLAYERS:
                 st.error(
@@ -343,40 +582,45 @@ def game_controls():
                 time.sleep(2)
                 st.rerun()
 
-            if game.check_teams():
-                st.success("Starting the game...")
-                game.start_game()
-                time.sleep(2)
-            else:
-                st.error(
-                    "Cannot start the game. Please check team and role assignments."
-                )
-                time.sleep(2)
-
+            result = game.start_game()
+            logger.info(
+                "Start turn requested",
+                extra={
+                    "started": result.ok,
+                    "violations": [v.rule.value for v in result.violations],
+                },
+            )
+            show_result(result)
+            time.sleep(2)
             st.rerun()
 
     else:
         if not st.session_state.get("in_game", False):
             st.session_state["in_game"] = True
-            print("Flipped the in_game state to True")
+            logger.debug("Flipped the in_game state to True")
             st.rerun()
 
     if st.button("🗑️ Reset Game"):
         # Clear the cache to get a fresh game instance
+        logger.info("Game reset")
+        get_rooms().close(DEFAULT_ROOM)
         get_shared_game.clear()
+        get_latency_tracer.clear()
+        get_snapshot_publisher.clear()
+        get_presence.clear()
         st.session_state.clear()
         st.success("Game reset!")
         st.rerun()
 
 
-def display_card(card: Card):
+def display_card(card: Card | TurnView):
     """Display a single card in sticky note style."""
     if not card:
         st.warning("No card to display.")
         return
 
     # Get current game to determine team context
-    game = get_shared_game()
+    game = get_game_view()
     current_player_name = st.session_state.get("player_name")
     team_color = "neutral"
 
@@ -398,14 +642,14 @@ def display_card(card: Card):
     )
 
 
-def display_card_hidden(card: Card):
+def display_card_hidden(card: Card | TurnView):
     """Display a single card in sticky note style with content hidden."""
     if not card:
         st.warning("No card to display.")
         return
 
     # Get current game to determine team context
-    game = get_shared_game()
+    game = get_game_view()
     current_player_name = st.session_state.get("player_name")
     team_color = "neutral"
 
@@ -427,9 +671,82 @@ def display_card_hidden(card: Card):
     )
 
 
+def display_leaderboard():
+    """Display the top players across all games and the current player's rank."""
+    leaderboard = get_leaderboard()
+
+    st.markdown("### 🏆 Leaderboard")
+    top_players = leaderboard.top(5)
+    if not top_players:
+        st.caption("No points scored yet.")
+        return
+
+    for i, stats in enumerate(top_players, start=1):
+        st.markdown(f"{i}. **{stats.name}** - {stats.points} pts")
+
+    player_name = st.session_state.get("player_name")
+    rank = leaderboard.rank(player_name) if player_name else None
+    if rank:
+        st.caption(f"Your rank: {rank} of {len(leaderboard)}")
+
+
+def display_game_over():
+    """Display the end-of-game report, built in the background once per game."""
+    view = get_game_view()
+    if view.report is None:
+        # Also covers games that ended before this process built their report
+        get_report_worker().submit(get_shared_game())
+        st.info("Preparing the final report...")
+        return
+
+    st.markdown(get_game_over_html(view.report), unsafe_allow_html=True)
+
+
+@adaptive_fragment(scale=2)
+def display_room_chat():
+    """Display the room chat, fetching only messages this session has not seen."""
+    game = get_shared_game()
+
+    # Start over when the game was reset, since the new chat numbers its
+    # messages from the beginning again. The chat itself is kept rather than
+    # its id, which a new chat could reuse once the old one is freed.
+    if st.session_state.get("chat") is not game.chat:
+        st.session_state["chat"] = game.chat
+        st.session_state["chat_log"] = deque(maxlen=CHAT_DISPLAY_SIZE)
+        st.session_state["chat_cursor"] = 0
+
+    new_messages = game.chat.messages_after(st.session_state["chat_cursor"])
+    if new_messages:
+        st.session_state["chat_log"].extend(
+            (m.sender.name, m.content) for m in new_messages
+        )
+        st.session_state["chat_cursor"] = new_messages[-1].id
+
+    st.markdown("### 💬 Room Chat")
+    with st.container(height=250):
+        for sender, content in st.session_state["chat_log"]:
+            st.write(f"**{sender}:** {content}")
+
+    name = st.session_state.get("player_name")
+    player = next((p for p in game.players if p.name == name), None)
+    if player is None:
+        st.caption("Join the game to chat.")
+        return
+
+    with st.form("chat_form", clear_on_submit=True):
+        message = st.text_input("Message:", max_chars=game.quotas.max_input_length)
+        sent = st.form_submit_button("Send")
+
+    if sent and action_allowed("chat"):
+        result = game.send_message(player, message)
+        show_result(result)
+        if result:
+            st.rerun()
+
+
 def display_scorecards():
     """Display fancy scorecards showing current game scores."""
-    game = get_shared_game()
+    game = get_game_view()
     team_a_score, team_b_score = game.score
 
     # Display the fancy scorecards
@@ -446,68 +763,67 @@ def display_scorecards():
     )
 
 
-def end_turn(score: int):
+def end_turn(score: int, claimed_by: Player | None = None):
     """End the current turn and update game state."""
 
     game = get_shared_game()
 
-    if score == 0:
-        game.turns[-1].score = (0, 0)
-
-    elif score == 1:
-        game.turns[-1].score = (1, 0) if game.guessing_team == Team.A else (0, 1)
-
-    elif score == -1:
-        game.turns[-1].score = (0, 1) if game.guessing_team == Team.A else (1, 0)
-
-    else:
-        st.error(
-            "Invalid score value. Use -1 for cheating, 0 for no score, or 1 for success."
-        )
+    if not game.end_turn(score, claimed_by):
+        if score not in (-1, 0, 1):
+            st.error(
+                "Invalid score value. Use -1 for cheating, 0 for no score, or 1 for success."
+            )
+        else:
+            st.warning("This turn has already ended.")
         return
 
-    game.turns[-1].end_turn = True
+    get_leaderboard().record(game.turns[-1].credits(claimed_by))
+
     st.session_state["in_game"] = False
-    print("Flipped the turn state to False")
+    logger.info(
+        "Turn ended",
+        extra={
+            "turn": game.current_turn,
+            "word": game.turns[-1].card.word,
+            "score": game.turns[-1].score,
+            "claimed_by": claimed_by.name if claimed_by else None,
+        },
+    )
 
 
 def chat_boxes():
     """Display chat boxes for hints and guesses."""
-    game = get_shared_game()
+    game = get_game_view()
+    if not game.turns:
+        return
+    turn = game.turns[-1]
 
     col1, col2 = st.columns(2)
 
     with col1:
         st.subheader("Hints")
-        st.markdown(
-            f"**Hints left:** {game.turns[-1].max_hints - len(game.turns[-1].hints)}"
-        )
+        st.markdown(f"**Hints left:** {turn.hints_left}")
         with st.container(height=250):
-            if game.turns:
-                for hint, hinter in zip(game.turns[-1].hints, game.turns[-1].hinters):
-                    st.write(f"💡 {hinter.name}: {hint.capitalize()}")
+            for hint, hinter in zip(turn.hints, turn.hinters):
+                st.write(f"💡 {hinter}: {hint.capitalize()}")
 
     with col2:
         st.subheader("Guesses")
-        st.markdown(
-            f"**Guesses left:** {game.turns[-1].max_guesses - len(game.turns[-1].guesses)}"
-        )
+        st.markdown(f"**Guesses left:** {turn.guesses_left}")
         with st.container(height=250):
-            if game.turns:
-                for guess, guesser in zip(
-                    game.turns[-1].guesses, game.turns[-1].guessers
-                ):
-                    st.write(f"💭 {guesser.name}: {guess.capitalize()}")
+            for guess, guesser in zip(turn.guesses, turn.guessers):
+                st.write(f"💭 {guesser}: {guess.capitalize()}")
 
 
 def card_and_chat(game, hidden=False):
     """Display the card and chat boxes side by side."""
+    turn = get_game_view().turn
     col1, col2 = st.columns(2)
     with col1:
         if hidden:
-            display_card_hidden(game.turns[game.current_turn - 1].card)
+            display_card_hidden(turn)
         else:
-            display_card(game.turns[game.current_turn - 1].card)
+            display_card(turn)
     with col2:
         chat_boxes()
 
@@ -530,15 +846,45 @@ def card_maker_controls():
         card_and_chat(game)
 
     else:
+        queued = len(game.card_queues[game.checking_team])
+        if queued and st.button(f"Use Next Prepared Card ({queued} ready)"):
+            result = game.play_queued_card()
+            show_result(result)
+            if result:
+                logger.info("Prepared card played", extra={"turn": game.current_turn})
+                st.rerun()
+
         st.subheader("Create New Card")
 
+        word_index = get_word_index()
+
         word = st.text_input("Word to guess:")
+        completions = word_index.complete(word)
+        if completions and word.strip().lower() not in completions:
+            completion = st.pills("Did you mean:", completions, key="word_completion")
+            if completion:
+                word = completion
+
+        suggested = st.multiselect(
+            "Suggested taboo words:",
+            options=word_index.suggest_taboo_words(word),
+            max_selections=NUMBER_OF_TABOO_WORDS,
+            key="taboo_suggestions",
+        )
         taboo_words = st.text_area("Taboo words (comma-separated):")
 
         if st.button("Create Card"):
-            if word and taboo_words:
-                taboo_list = [w.strip() for w in taboo_words.split(",") if w.strip()]
-                game.make_card(word, taboo_list)
+            taboo_list = suggested + [
+                w.strip() for w in taboo_words.split(",") if w.strip()
+            ]
+            if word and taboo_list:
+                result = game.make_card(word, taboo_list)
+                show_result(result)
+                if not result:
+                    return
+
+                word_index.learn(word, taboo_list)
+                logger.info("Card created", extra={"turn": game.current_turn})
                 st.success(
                     f"Card created for '{word}' with taboo words: {', '.join(taboo_list)}"
                 )
@@ -548,6 +894,37 @@ def card_maker_controls():
                 st.error("Please provide both a word and taboo words.")
 
 
+def card_queue_controls():
+    """Let players prepare cards for their team's upcoming card making turns."""
+    game = get_shared_game()
+
+    name = st.session_state.get("player_name")
+    player = next((p for p in game.players if p.name == name), None)
+    if player is None or player.team == Team.U:
+        return
+
+    queue = list(game.card_queues[player.team])
+    with st.expander(f"Prepared Cards ({len(queue)}/{MAX_QUEUED_CARDS})"):
+        for card in queue:
+            st.caption(f"**{card.word}**: {', '.join(card.taboo_words)}")
+
+        word = st.text_input("Word to guess:", key="queue_word")
+        taboo_words = st.text_input(
+            "Taboo words (comma-separated):", key="queue_taboo_words"
+        )
+        if st.button("Prepare Card") and action_allowed("queue_card"):
+            taboo_list = [w.strip() for w in taboo_words.split(",") if w.strip()]
+            if word and taboo_list:
+                result = game.queue_card(player.team, word, taboo_list)
+                show_result(result)
+                if result:
+                    get_word_index().learn(word, taboo_list)
+                    logger.info("Card prepared", extra={"team": player.team.value})
+                    st.rerun()
+            else:
+                st.error("Please provide both a word and taboo words.")
+
+
 def leader_interface():
     """Display the leader interface for managing game state."""
     game = get_shared_game()
@@ -574,15 +951,20 @@ def leader_interface():
 
         card_and_chat(game)
 
-        new_hint = st.text_input("Add a new hint:")
-        if st.button("Add Hint"):
+        new_hint = st.text_input(
+            "Add a new hint:", max_chars=game.quotas.max_input_length
+        )
+        if st.button("Add Hint") and action_allowed("hint"):
             if (
                 new_hint.strip()
                 and new_hint.strip().capitalize() not in game.turns[-1].hints
             ):
 
                 if len(game.turns[-1].hints) < game.turns[-1].max_hints:
-                    game.turns[-1].add_hint(new_hint, player)
+                    result = game.add_hint(new_hint, player)
+                    if not result:
+                        show_result(result)
+                        return
                 else:
                     st.error("Maximum hints reached for this turn.")
                     time.sleep(2)
@@ -629,19 +1011,24 @@ def guesser_interface():
 
         card_and_chat(game)
 
-        new_guess = st.text_input("Add a new guess:")
-        if st.button("Add Guess"):
+        new_guess = st.text_input(
+            "Add a new guess:", max_chars=game.quotas.max_input_length
+        )
+        if st.button("Add Guess") and action_allowed("guess"):
             if (
                 new_guess.strip()
                 and new_guess.strip().capitalize() not in game.turns[-1].guesses
             ):
 
-                game.turns[-1].add_guess(new_guess, player)
+                result = game.add_guess(new_guess, player)
+                if not result:
+                    show_result(result)
+                    return
 
                 if game.turns[-1].successfully_guessed:
                     end_turn(1)
 
-                if len(game.turns[-1].guesses) >= game.turns[-1].max_guesses:
+                elif len(game.turns[-1].guesses) >= game.turns[-1].max_guesses:
                     end_turn(0)
 
                 st.rerun()
@@ -651,8 +1038,6 @@ def checker_interface():
     """Display the checker interface for managing game state."""
     game = get_shared_game()
 
-    # player = st.session_state.get("player_name")
-
     if (
         game.turns
         and len(game.turns) == game.current_turn
@@ -661,8 +1046,16 @@ def checker_interface():
 
         card_and_chat(game)
 
-        if st.button("Claim Cheating", width="stretch"):
-            end_turn(-1)
+        if st.button("Claim Cheating", width="stretch") and action_allowed("cheat"):
+            claimed_by = next(
+                (
+                    p
+                    for p in game.players
+                    if p.name == st.session_state.get("player_name")
+                ),
+                None,
+            )
+            end_turn(-1, claimed_by)
 
     else:
         st.info("No card created yet. Please create a card first.")
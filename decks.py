@@ -0,0 +1,298 @@
+"""This module imports card decks from large CSV or YAML files.
+
+Entries are streamed from the input in chunks and checked and normalized
+across a process pool, with only a few chunks in flight at a time, so memory
+stays bounded by the chunk size rather than the file size. Valid cards are
+written to a compact JSON-lines deck file, one card per line, and rejected
+entries to a CSV report listing the rules they broke. Only the normalized
+words of accepted cards are kept in memory, to reject duplicates across the
+deck; the first occurrence of a word wins.
+
+CSV rows hold the card word followed by its taboo words, one per column; a
+header row starting with "word" is skipped. YAML files hold mappings with
+"word" and "taboo_words" keys, either one per document or as a list. For
+very large decks prefer CSV or one card per YAML document, since a single
+YAML list is parsed in one piece.
+
+Usage:
+    python decks.py import cards.csv -o deck.jsonl --rejects rejects.csv
+    python decks.py import cards.yaml -o deck.jsonl --workers 8
+"""
+
+import argparse
+import csv
+import json
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import IO, Iterable, Iterator
+
+import yaml
+
+from backend import (
+    Card,
+    NUMBER_OF_TABOO_WORDS,
+    Rule,
+    Violation,
+    check_card_entry,
+    normalize_word,
+)
+
+DECK_VERSION = 1
+CHUNK_SIZE = 10000
+
+REJECT_FIELDS = ["entry", "word", "taboo_words", "rules", "message"]
+
+# An entry is its position in the input (the CSV line or the YAML entry
+# number), the card word and the raw taboo words.
+Entry = tuple[int, str, list[str]]
+
+
+class DeckError(ValueError):
+    """Raised when a deck or card file cannot be read."""
+
+
+@dataclass
+class CheckedEntry:
+    """Data class to hold a normalized entry and the rules it broke."""
+
+    entry: int
+    key: str
+    word: str
+    taboo_words: list[str]
+    violations: list[Violation] = field(default_factory=list)
+
+
+@dataclass
+class ImportReport:
+    """Data class to hold the outcome of a deck import."""
+
+    entries: int = 0
+    imported: int = 0
+    rejected: int = 0
+    rules: Counter = field(default_factory=Counter)
+    elapsed: float = 0.0
+
+
+def display_word(word: str) -> str:
+    """Format a word the way cards show it."""
+    return " ".join(word.split()).capitalize()
+
+
+def check_entry(entry: Entry) -> CheckedEntry:
+    """Check one entry and normalize its words, keeping taboo word order."""
+    position, word, taboo_words = entry
+    unique = {}
+    for taboo_word in taboo_words:
+        key = normalize_word(taboo_word)
+        if key and key not in unique:
+            unique[key] = display_word(taboo_word)
+
+    return CheckedEntry(
+        entry=position,
+        key=normalize_word(word),
+        word=display_word(word),
+        taboo_words=list(unique.values()),
+        violations=check_card_entry(word, taboo_words),
+    )
+
+
+def check_chunk(chunk: list[Entry]) -> list[CheckedEntry]:
+    """Check a chunk of entries in a worker process."""
+    return [check_entry(entry) for entry in chunk]
+
+
+def iter_csv_entries(fp: IO[str]) -> Iterator[Entry]:
+    """Read entries from CSV rows of a word followed by its taboo words."""
+    reader = csv.reader(fp)
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        if reader.line_num == 1 and row[0].strip().lower() == "word":
+            continue
+        yield reader.line_num, row[0], row[1:]
+
+
+def iter_yaml_entries(fp: IO[str]) -> Iterator[Entry]:
+    """Read entries from YAML documents holding one card or a list of cards."""
+    position = 0
+    for document in yaml.safe_load_all(fp):
+        if document is None:
+            continue
+        for card in document if isinstance(document, list) else [document]:
+            position += 1
+            if not isinstance(card, dict):
+                raise DeckError(f"Entry {position} is not a mapping.")
+            taboo_words = card.get("taboo_words") or []
+            if isinstance(taboo_words, str):
+                taboo_words = taboo_words.split(",")
+            yield position, str(card.get("word") or ""), [str(w) for w in taboo_words]
+
+
+def iter_entries(path: str) -> Iterator[Entry]:
+    """Stream the entries of a CSV or YAML card file."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if path.endswith((".yaml", ".yml")):
+            yield from iter_yaml_entries(f)
+        else:
+            yield from iter_csv_entries(f)
+
+
+def chunked(entries: Iterable[Entry], size: int) -> Iterator[list[Entry]]:
+    """Group entries into lists of at most size entries."""
+    chunk = []
+    for entry in entries:
+        chunk.append(entry)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def check_chunks(
+    chunks: Iterable[list[Entry]], workers: int
+) -> Iterator[list[CheckedEntry]]:
+    """Check chunks across a process pool, in input order.
+
+    At most two chunks per worker are submitted ahead of the one being
+    consumed, so a slow writer never lets the input pile up in memory.
+    """
+    if workers == 1:
+        yield from map(check_chunk, chunks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(check_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def write_deck_header(fp: IO[str]):
+    """Write the first line of a deck file."""
+    header = {"v": DECK_VERSION, "taboo_words": NUMBER_OF_TABOO_WORDS}
+    fp.write(json.dumps(header, separators=(",", ":")) + "\n")
+
+
+def write_reject(writer: csv.DictWriter, checked: CheckedEntry):
+    """Write one rejected entry to the report."""
+    writer.writerow(
+        {
+            "entry": checked.entry,
+            "word": checked.word,
+            "taboo_words": "|".join(checked.taboo_words),
+            "rules": ";".join(v.rule.value for v in checked.violations),
+            "message": " ".join(v.message for v in checked.violations),
+        }
+    )
+
+
+def import_deck(
+    path: str,
+    output: str,
+    rejects: str,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> ImportReport:
+    """Import a card file into a deck file and write a report of rejects."""
+    workers = workers or os.cpu_count() or 1
+    report = ImportReport()
+    seen: set[str] = set()
+
+    start = time.perf_counter()
+    with (
+        open(output, "w", encoding="utf-8") as deck,
+        open(rejects, "w", encoding="utf-8", newline="") as rejects_file,
+    ):
+        write_deck_header(deck)
+        reject_writer = csv.DictWriter(rejects_file, fieldnames=REJECT_FIELDS)
+        reject_writer.writeheader()
+
+        chunks = chunked(iter_entries(path), chunk_size)
+        for checked_chunk in check_chunks(chunks, workers):
+            for checked in checked_chunk:
+                report.entries += 1
+                if not checked.violations and checked.key in seen:
+                    checked.violations.append(
+                        Violation(
+                            Rule.DUPLICATE_CARD,
+                            f"Card '{checked.word}' is already in the deck.",
+                        )
+                    )
+
+                if checked.violations:
+                    report.rejected += 1
+                    report.rules.update(v.rule.value for v in checked.violations)
+                    write_reject(reject_writer, checked)
+                    continue
+
+                seen.add(checked.key)
+                report.imported += 1
+                deck.write(
+                    json.dumps(
+                        [checked.word, checked.taboo_words],
+                        ensure_ascii=False,
+                        separators=(",", ":"),
+                    )
+                    + "\n"
+                )
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def iter_deck(fp: IO[str]) -> Iterator[Card]:
+    """Read the cards of a deck file one at a time."""
+    try:
+        header = json.loads(fp.readline())
+    except json.JSONDecodeError as e:
+        raise DeckError(f"Deck header is not valid JSON: {e}") from e
+    if not isinstance(header, dict) or header.get("v") != DECK_VERSION:
+        raise DeckError("Not a deck file or unsupported deck version.")
+
+    for line in fp:
+        if line.strip():
+            word, taboo_words = json.loads(line)
+            yield Card(word, taboo_words)
+
+
+def main(argv: list[str] | None = None):
+    """Run the deck import command line interface."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="Import a card file.")
+    import_parser.add_argument("cards")
+    import_parser.add_argument("-o", "--output", required=True)
+    import_parser.add_argument("--rejects", default=None)
+    import_parser.add_argument("--workers", type=int, default=None)
+    import_parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    args = parser.parse_args(argv)
+
+    rejects = args.rejects or f"{os.path.splitext(args.output)[0]}.rejects.csv"
+    try:
+        report = import_deck(
+            args.cards, args.output, rejects, args.workers, args.chunk_size
+        )
+    except (OSError, DeckError) as e:
+        parser.exit(1, f"Import failed: {e}\n")
+
+    rate = report.entries / report.elapsed if report.elapsed else 0
+    print(
+        f"Imported {report.imported} of {report.entries} cards to {args.output} "
+        f"in {report.elapsed:.2f} s ({rate:.0f} entries/s)"
+    )
+    print(f"{report.rejected} rejected, see {rejects}")
+    for rule, count in report.rules.most_common():
+        print(f"  {rule}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""This module provides word completion and taboo word suggestions for card makers.
+
+The dictionary is a plain text file with one word per line, optionally
+followed by a tab and a comma-separated list of related words:
+
+    apple\tfruit, tree, red, pie, cider
+
+Words are kept in a sorted list so completions are a binary search plus a
+short slice, which stays well under a millisecond for dictionaries of a few
+hundred thousand words. Related words from the file are combined with the
+taboo words of every card made in the game, so suggestions improve as people
+play. The index is shared by all sessions, so every lookup and update
+holds its lock.
+
+By default the words come from the system word list at /usr/share/dict/words,
+which holds around a hundred thousand words on most systems, combined with
+the small dictionary shipped as words.txt, which also provides the related
+words. Missing files are skipped.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+
+DICTIONARY_PATH = os.environ.get(
+    "TABOO_DICTIONARY", os.path.join(os.path.dirname(__file__), "words.txt")
+)
+WORD_LIST_PATH = os.environ.get("TABOO_WORD_LIST", "/usr/share/dict/words")
+
+MAX_COMPLETIONS = 8
+MAX_SUGGESTIONS = 10
+
+
+def normalize(word: str) -> str:
+    """Normalize a word for lookups."""
+    return word.strip().lower()
+
+
+class WordIndex:
+    """Thread-safe sorted word list with completion and related word suggestions."""
+
+    def __init__(self, words=(), related: dict[str, Counter] | None = None):
+        self.words = sorted({normalize(w) for w in words if w.strip()})
+        self.related: dict[str, Counter] = related or {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str | None = None) -> "WordIndex":
+        """Load dictionary files, skipping any that are missing.
+
+        Without a path, the word list and the bundled dictionary are combined.
+        """
+        words = []
+        related: dict[str, Counter] = {}
+        for path in [path] if path else [WORD_LIST_PATH, DICTIONARY_PATH]:
+            if not os.path.exists(path):
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    word, _, rest = line.partition("\t")
+                    word = normalize(word)
+                    # System word lists also hold possessives such as "apple's".
+                    if not word or "'" in word:
+                        continue
+                    words.append(word)
+                    if rest.strip():
+                        related.setdefault(word, Counter()).update(
+                            normalize(r) for r in rest.split(",") if r.strip()
+                        )
+
+        return cls(words, related)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        word = normalize(word)
+        with self.lock:
+            i = bisect_left(self.words, word)
+            return i < len(self.words) and self.words[i] == word
+
+    def complete(self, prefix: str, limit: int = MAX_COMPLETIONS) -> list[str]:
+        """Return up to limit dictionary words starting with the prefix."""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+
+        completions = []
+        with self.lock:
+            i = bisect_left(self.words, prefix)
+            while i < len(self.words) and len(completions) < limit:
+                word = self.words[i]
+                if not word.startswith(prefix):
+                    break
+                completions.append(word)
+                i += 1
+        return completions
+
+    def suggest_taboo_words(self, word: str, limit: int = MAX_SUGGESTIONS) -> list[str]:
+        """Return the words most often related to a word, most common first."""
+        word = normalize(word)
+        with self.lock:
+            related = self.related.get(word)
+            if not related:
+                return []
+            common = related.most_common(limit + 1)
+        return [w for w, _ in common if w != word][:limit]
+
+    def learn(self, word: str, taboo_words: list[str]):
+        """Remember the taboo words chosen for a word on a new card."""
+        word = normalize(word)
+        taboo_words = [normalize(taboo_word) for taboo_word in taboo_words]
+        with self.lock:
+            i = bisect_left(self.words, word)
+            if i == len(self.words) or self.words[i] != word:
+                self.words.insert(i, word)
+
+            related = self.related.setdefault(word, Counter())
+            for taboo_word in taboo_words:
+                related[taboo_word] += 1
+                self.related.setdefault(taboo_word, Counter())[word] += 1
+
+
+def benchmark(path: str | None = None, repeat: int = 10000):
+    """Print load and completion timings for a dictionary file."""
+    start = time.perf_counter()
+    index = WordIndex.load(path)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    prefixes = [w[:3] for w in index.words[:: max(1, len(index) // repeat)]]
+    start = time.perf_counter()
+    for prefix in prefixes:
+        index.complete(prefix)
+    complete_us = (time.perf_counter() - start) * 1e6 / max(1, len(prefixes))
+
+    print(f"Words: {len(index)}, load: {load_ms:.0f} ms")
+    print(f"Completion: {complete_us:.1f} us per prefix")
+
+
+if __name__ == "__main__":
+    benchmark()
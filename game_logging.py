@@ -0,0 +1,115 @@
+"""This module sets up non-blocking structured logging for the Taboo game.
+
+Handlers on the hot path only put records on a bounded in-memory queue. A
+background listener thread formats them as JSON lines and writes them to a
+size-rotated file, so request handlers never wait on disk I/O. When the queue
+is full, new records are dropped and counted instead of blocking.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from contextvars import ContextVar
+from datetime import datetime, timezone
+
+from tracing import current_session
+
+LOG_PATH = os.environ.get(
+    "TABOO_LOG_FILE", os.path.join(os.path.dirname(__file__), "logs", "taboo.log")
+)
+LOG_LEVEL = os.environ.get("TABOO_LOG_LEVEL", "INFO")
+MAX_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 5
+QUEUE_SIZE = 10000
+
+LOGGER_NAME = "taboo"
+
+# Room the current script run is acting on, added to every record.
+current_room: ContextVar[str] = ContextVar("current_room", default="default")
+
+# Attributes every LogRecord has, used to find the extra fields of a record.
+RESERVED_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message"}
+
+
+class JSONFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in RESERVED_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class ContextFilter(logging.Filter):
+    """Add the current room and session to every record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.room = current_room.get()
+        record.session = current_session.get()
+        return True
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener: logging.handlers.QueueListener | None = None
+_lock = threading.Lock()
+
+
+def setup_logging(path: str = LOG_PATH) -> logging.Logger:
+    """Start the background log writer once per process and return the game logger."""
+    global _listener
+
+    logger = logging.getLogger(LOGGER_NAME)
+    with _lock:
+        if _listener is not None:
+            return logger
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8"
+        )
+        file_handler.setFormatter(JSONFormatter())
+
+        log_queue: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+        queue_handler = DroppingQueueHandler(log_queue)
+        queue_handler.addFilter(ContextFilter())
+
+        logger.addHandler(queue_handler)
+        logger.setLevel(LOG_LEVEL)
+        logger.propagate = False
+
+        _listener = logging.handlers.QueueListener(log_queue, file_handler)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+    return logger
+
+
+def get_logger(name: str = "") -> logging.Logger:
+    """Return the game logger or one of its children."""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
@@ -1,9 +1,18 @@
 """HTML templates and markup for the Taboo game UI components."""
 
+import functools
 import streamlit as st
 import os
+from html import escape
 
+from report import GameReport
 
+# Maximum number of rendered fragments kept per template function. Inputs only
+# change a few times per turn, so the same HTML is shared by every viewer.
+HTML_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=None)
 def load_template(template_name):
     """Load HTML template from file"""
     template_path = os.path.join(os.path.dirname(__file__), "templates", template_name)
@@ -25,6 +34,7 @@ def get_player_board_close():
     return load_template("player_board_close.html")
 
 
+@functools.lru_cache(maxsize=HTML_CACHE_SIZE)
 def get_game_stats_html(player_count: int, ongoing: bool, current_round: int) -> str:
     """Generate HTML for game statistics display."""
     template = load_template("game_stats.html")
@@ -92,6 +102,12 @@ def get_taboo_card_html(
     word: str, taboo_words: list, team_color: str = "neutral"
 ) -> str:
     """Generate HTML for a sticky note style taboo card."""
+    return render_taboo_card(word, tuple(taboo_words), team_color)
+
+
+@functools.lru_cache(maxsize=HTML_CACHE_SIZE)
+def render_taboo_card(word: str, taboo_words: tuple, team_color: str) -> str:
+    """Render a taboo card, cached on its word, taboo words and team colour."""
     template = load_template("taboo_card.html")
 
     # Create taboo words grid (2 columns)
@@ -117,11 +133,17 @@ def get_taboo_card_hidden_html(
     word: str, taboo_words: list, team_color: str = "neutral"
 ) -> str:
     """Generate HTML for a hidden sticky note style taboo card."""
+    return render_taboo_card_hidden(len(taboo_words), team_color)
+
+
+@functools.lru_cache(maxsize=HTML_CACHE_SIZE)
+def render_taboo_card_hidden(taboo_word_count: int, team_color: str) -> str:
+    """Render a hidden taboo card, which only depends on the number of taboo words."""
     template = load_template("taboo_card_hidden.html")
 
     # Create hidden taboo words (show count but not content)
     hidden_taboo_items = ""
-    for _ in range(len(taboo_words)):
+    for _ in range(taboo_word_count):
         hidden_taboo_items += '<span class="taboo-word">• ●●●●●</span>'
 
     team_class = (
@@ -137,6 +159,7 @@ def get_taboo_card_hidden_html(
     )
 
 
+@functools.lru_cache(maxsize=HTML_CACHE_SIZE)
 def get_scorecard_html(
     team_a_score: int,
     team_b_score: int,
@@ -168,3 +191,61 @@ def get_scorecard_html(
         team_a_progress=team_a_progress,
         team_b_progress=team_b_progress,
     )
+
+
+def _report_list(items: list[str], empty: str) -> str:
+    """Render report lines as an HTML list, or a note when there are none."""
+    if not items:
+        return f'<p class="report-empty">{empty}</p>'
+    return "<ol>" + "".join(f"<li>{item}</li>" for item in items) + "</ol>"
+
+
+@functools.lru_cache(maxsize=HTML_CACHE_SIZE)
+def get_game_over_html(report: GameReport) -> str:
+    """Generate HTML for the end-of-game report, once per report."""
+    template = load_template("game_over.html")
+    team_a_score, team_b_score = report.score
+
+    scores_html = (
+        f"<p><strong>Team A:</strong> {team_a_score} - "
+        f"<strong>Team B:</strong> {team_b_score}</p>"
+    )
+    winner_text = f"{report.winner.value} Wins!" if report.winner else "It's a Tie!"
+
+    rounds = [f"Round {i}: {a} - {b}" for i, (a, b) in enumerate(report.rounds, 1)]
+    guessers = [
+        f"<strong>{escape(name)}</strong> - {count} correct"
+        for name, count in report.best_guessers
+    ]
+    cards = [
+        f"<strong>{escape(word)}</strong> - {hints} hints, {guesses} guesses"
+        + ("" if guessed else " (not guessed)")
+        for word, hints, guesses, guessed in report.hardest_cards
+    ]
+    taboo_hits = [
+        f"<strong>{escape(player)}</strong> said '{escape(hint)}' for "
+        f"{escape(word)}"
+        for player, word, hint in report.taboo_hits
+    ]
+
+    return template.format(
+        scores_html=scores_html,
+        winner_text=winner_text,
+        rounds_html=_report_list(rounds, "No turns were played."),
+        guessers_html=_report_list(guessers, "Nobody guessed a word."),
+        cards_html=_report_list(cards, "No cards were played."),
+        taboo_html=_report_list(taboo_hits, "No taboo words were said."),
+    )
+
+
+def get_html_cache_stats() -> dict[str, dict[str, int]]:
+    """Return hit and miss counters for the rendered HTML caches."""
+    cached = [
+        load_template,
+        get_game_stats_html,
+        render_taboo_card,
+        render_taboo_card_hidden,
+        get_scorecard_html,
+        get_game_over_html,
+    ]
+    return {func.__name__: func.cache_info()._asdict() for func in cached}
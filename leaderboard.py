@@ -0,0 +1,142 @@
+"""This module keeps a persistent leaderboard of player achievements across games.
+
+Stats are credited at the end of every turn and saved to a local JSON file,
+so they survive game resets and server restarts. Saves are debounced and run
+in a background timer thread, so ending a turn never waits for the disk and
+a burst of turns is written once. The ranking is a list of (-points, name)
+pairs kept sorted, so a player's rank is a binary search and the top K
+players are a slice; updating it moves list items, which is O(n) but cheap
+for leaderboards of a few thousand players.
+"""
+
+import atexit
+import json
+import os
+import threading
+from bisect import bisect_left, insort
+from dataclasses import dataclass, asdict
+from typing import Iterable
+
+from backend import Player, Stat
+
+LEADERBOARD_PATH = os.environ.get(
+    "TABOO_LEADERBOARD", os.path.join(os.path.dirname(__file__), "leaderboard.json")
+)
+SAVE_DELAY = 2.0
+
+
+@dataclass
+class PlayerStats:
+    """Data class to hold the achievements of one player."""
+
+    name: str
+    correct_guesses: int = 0
+    successful_hints: int = 0
+    caught_cheats: int = 0
+
+    @property
+    def points(self) -> int:
+        """Total points used for ranking."""
+        return self.correct_guesses + self.successful_hints + self.caught_cheats
+
+
+class Leaderboard:
+    """Thread-safe leaderboard with rank and top-K lookups."""
+
+    def __init__(self, path: str | None = None, save_delay: float = SAVE_DELAY):
+        self.path = path
+        self.save_delay = save_delay
+        self.stats: dict[str, PlayerStats] = {}
+        self.ranking: list[tuple[int, str]] = []
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.save_timer: threading.Timer | None = None
+        if path is not None:
+            atexit.register(self.flush)
+
+    @classmethod
+    def load(cls, path: str = LEADERBOARD_PATH) -> "Leaderboard":
+        """Load a leaderboard file, starting empty if it is missing."""
+        leaderboard = cls(path)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for row in json.load(f):
+                    stats = PlayerStats(**row)
+                    leaderboard.stats[stats.name] = stats
+            leaderboard.ranking = sorted(
+                (-s.points, s.name) for s in leaderboard.stats.values()
+            )
+        return leaderboard
+
+    def save(self):
+        """Write the leaderboard to its file, replacing it atomically."""
+        if self.path is None:
+            return
+
+        with self.lock:
+            self.save_timer = None
+            rows = [asdict(s) for s in self.stats.values()]
+
+        # Writes are serialized so an older snapshot never replaces a newer one.
+        with self.save_lock:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(rows, f)
+            os.replace(temp_path, self.path)
+
+    def schedule_save(self):
+        """Save in a background thread after save_delay, unless one is pending.
+
+        Must be called with the lock held.
+        """
+        if self.path is None or self.save_timer is not None:
+            return
+
+        self.save_timer = threading.Timer(self.save_delay, self.save)
+        self.save_timer.daemon = True
+        self.save_timer.start()
+
+    def flush(self):
+        """Save now if a save is pending, such as when the process exits."""
+        with self.lock:
+            timer = self.save_timer
+        if timer is not None:
+            timer.cancel()
+            self.save()
+
+    def record(self, credits: Iterable[tuple[Player, Stat]]):
+        """Credit players for the end of a turn and schedule a save."""
+        credits = list(credits)
+        if not credits:
+            return
+
+        with self.lock:
+            for player, stat in credits:
+                stats = self.stats.get(player.name)
+                if stats is None:
+                    stats = self.stats[player.name] = PlayerStats(player.name)
+                else:
+                    self.ranking.pop(
+                        bisect_left(self.ranking, (-stats.points, stats.name))
+                    )
+
+                setattr(stats, stat.value, getattr(stats, stat.value) + 1)
+                insort(self.ranking, (-stats.points, stats.name))
+
+            self.schedule_save()
+
+    def top(self, k: int = 10) -> list[PlayerStats]:
+        """Return the k players with the most points."""
+        with self.lock:
+            return [self.stats[name] for _, name in self.ranking[:k]]
+
+    def rank(self, name: str) -> int | None:
+        """Return the 1-based rank of a player, with ties sharing a rank."""
+        with self.lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                return None
+            return bisect_left(self.ranking, (-stats.points, "")) + 1
+
+    def __len__(self) -> int:
+        return len(self.stats)
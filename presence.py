@@ -0,0 +1,123 @@
+"""This module tracks which sessions in a room are still open.
+
+Every script or fragment run of a session sends a heartbeat. Sessions that
+have not sent one for longer than the timeout are expired, and players with
+no open session left are idle: they are either marked as idle or removed from
+the game, so closed tabs stop blocking the readiness checks. Players are only
+removed between turns; during a turn they are marked instead.
+"""
+
+import os
+import threading
+import time
+from enum import Enum
+
+from backend import Game
+from game_logging import get_logger
+
+# Fragments rerun at most every MAX_INTERVAL seconds, or slower in phases
+# with longer intervals, so the timeout leaves room for a few missed runs.
+PRESENCE_TIMEOUT = float(os.environ.get("TABOO_PRESENCE_TIMEOUT", 60))
+SWEEP_EVERY = 5.0
+
+logger = get_logger("presence")
+
+
+class IdlePolicy(Enum):
+    """Enum to represent what happens to players whose sessions expired."""
+
+    MARK = "mark"
+    REMOVE = "remove"
+
+
+IDLE_POLICY = IdlePolicy(os.environ.get("TABOO_IDLE_POLICY", IdlePolicy.MARK.value))
+
+
+class Presence:
+    """Thread-safe table of the last heartbeat of every session in one room."""
+
+    def __init__(
+        self,
+        timeout: float = PRESENCE_TIMEOUT,
+        policy: IdlePolicy = IDLE_POLICY,
+    ):
+        self.timeout = timeout
+        self.policy = policy
+        self.sessions: dict[str, tuple[str | None, float]] = {}
+        self.seen_players: set[str] = set()
+        self.last_sweep = 0.0
+        self.lock = threading.Lock()
+
+    def heartbeat(
+        self, session_id: str, player_name: str | None, now: float | None = None
+    ):
+        """Record that a session, playing as player_name if set, is open."""
+        now = time.time() if now is None else now
+        with self.lock:
+            self.sessions[session_id] = (player_name, now)
+            if player_name is not None:
+                self.seen_players.add(player_name)
+
+    def leave(self, session_id: str):
+        """Forget a session that was closed on purpose."""
+        with self.lock:
+            self.sessions.pop(session_id, None)
+
+    def active_players(self) -> set[str]:
+        """Return the names of players with at least one open session."""
+        with self.lock:
+            return {name for name, _ in self.sessions.values() if name is not None}
+
+    def expire(self, now: float | None = None) -> list[str]:
+        """Drop the sessions that missed the timeout and return their ids."""
+        now = time.time() if now is None else now
+        with self.lock:
+            expired = [
+                session_id
+                for session_id, (_, last_seen) in self.sessions.items()
+                if now - last_seen > self.timeout
+            ]
+            for session_id in expired:
+                del self.sessions[session_id]
+        return expired
+
+    def sweep(self, game: Game, now: float | None = None) -> list[str]:
+        """Expire sessions and apply the idle policy to the game.
+
+        Players who never sent a heartbeat, such as bots, are left alone.
+        Returns the ids of the expired sessions.
+        """
+        expired = self.expire(now)
+        active = self.active_players()
+
+        for player in list(game.players):
+            if player.name not in self.seen_players:
+                continue
+
+            if player.name in active:
+                if player.is_idle:
+                    game.set_idle(player, False)
+                continue
+
+            if self.policy == IdlePolicy.REMOVE and not game.ongoing:
+                game.remove_player(player)
+                with self.lock:
+                    self.seen_players.discard(player.name)
+                logger.info("Idle player removed", extra={"player": player.name})
+            elif not player.is_idle:
+                game.set_idle(player, True)
+                logger.info("Player marked idle", extra={"player": player.name})
+
+        return expired
+
+    def maybe_sweep(self, game: Game, now: float | None = None) -> list[str]:
+        """Sweep at most once every SWEEP_EVERY seconds."""
+        now = time.time() if now is None else now
+        with self.lock:
+            if now - self.last_sweep < SWEEP_EVERY:
+                return []
+            self.last_sweep = now
+        return self.sweep(game, now)
+
+    def __len__(self) -> int:
+        return len(self.sessions)
@@ -0,0 +1,133 @@
+"""This module provides token bucket rate limiting for game actions.
+
+Each action is limited both per session and per room, so a single client
+cannot flood the shared game and a room as a whole cannot exceed what the
+server is willing to spend on it.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Limit:
+    """Data class to represent a token bucket size and refill rate."""
+
+    capacity: float
+    per_second: float
+
+
+SESSION_LIMITS = {
+    "join": Limit(capacity=3, per_second=0.2),
+    "hint": Limit(capacity=2, per_second=0.5),
+    "guess": Limit(capacity=3, per_second=1),
+    "cheat": Limit(capacity=1, per_second=0.2),
+    "queue_card": Limit(capacity=3, per_second=0.2),
+    "chat": Limit(capacity=5, per_second=0.5),
+}
+
+ROOM_LIMITS = {
+    "join": Limit(capacity=20, per_second=2),
+    "hint": Limit(capacity=5, per_second=1),
+    "guess": Limit(capacity=20, per_second=5),
+    "cheat": Limit(capacity=3, per_second=0.5),
+    "queue_card": Limit(capacity=10, per_second=1),
+    "chat": Limit(capacity=20, per_second=5),
+}
+
+PRUNE_EVERY = 1000
+
+
+@dataclass
+class TokenBucket:
+    """Data class to represent a token bucket."""
+
+    limit: Limit
+    tokens: float = 0.0
+    updated_at: float = field(default_factory=time.monotonic)
+
+    def __post_init__(self):
+        self.tokens = self.limit.capacity
+
+    def refill(self, now: float):
+        """Add the tokens earned since the last update."""
+        elapsed = max(now - self.updated_at, 0.0)
+        self.tokens = min(
+            self.limit.capacity, self.tokens + elapsed * self.limit.per_second
+        )
+        self.updated_at = now
+
+    @property
+    def is_full(self) -> bool:
+        """Check if the bucket has refilled completely."""
+        return self.tokens >= self.limit.capacity
+
+
+class RateLimiter:
+    """Thread-safe per-session and per-room limits on game actions."""
+
+    def __init__(
+        self,
+        session_limits: dict[str, Limit] | None = None,
+        room_limits: dict[str, Limit] | None = None,
+    ):
+        self.session_limits = (
+            SESSION_LIMITS if session_limits is None else session_limits
+        )
+        self.room_limits = ROOM_LIMITS if room_limits is None else room_limits
+        self.buckets: dict[tuple[str, str, str], TokenBucket] = {}
+        self.rejected: dict[str, int] = {}
+        self.lock = threading.Lock()
+        self.calls = 0
+
+    def bucket(self, scope: str, key: str, action: str, limit: Limit) -> TokenBucket:
+        """Get or create the bucket for a scope, key and action."""
+        bucket_key = (scope, key, action)
+        bucket = self.buckets.get(bucket_key)
+        if bucket is None:
+            bucket = self.buckets[bucket_key] = TokenBucket(limit)
+        return bucket
+
+    def allow(self, action: str, session_id: str, room_id: str = "default") -> bool:
+        """Take a token for the action from both the session and the room.
+
+        Tokens are only taken when both buckets have one, so a rejection by
+        the room does not also cost the session.
+        """
+        now = time.monotonic()
+        with self.lock:
+            buckets = []
+            if action in self.session_limits:
+                buckets.append(
+                    self.bucket(
+                        "session", session_id, action, self.session_limits[action]
+                    )
+                )
+            if action in self.room_limits:
+                buckets.append(
+                    self.bucket("room", room_id, action, self.room_limits[action])
+                )
+
+            for bucket in buckets:
+                bucket.refill(now)
+
+            allowed = all(bucket.tokens >= 1 for bucket in buckets)
+            if allowed:
+                for bucket in buckets:
+                    bucket.tokens -= 1
+            else:
+                self.rejected[action] = self.rejected.get(action, 0) + 1
+
+            self.calls += 1
+            if self.calls % PRUNE_EVERY == 0:
+                self.prune(now)
+
+        return allowed
+
+    def prune(self, now: float):
+        """Drop buckets that have refilled, as they hold no state worth keeping."""
+        for key, bucket in list(self.buckets.items()):
+            bucket.refill(now)
+            if bucket.is_full:
+                del self.buckets[key]
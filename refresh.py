@@ -0,0 +1,57 @@
+"""This module decides how often each session's fragments should rerun.
+
+Intervals depend on the game phase and the viewer's role: players who act
+during a turn poll quickly, players who only watch poll slowly. When a
+session has not interacted for a while its interval doubles step by step, so
+background tabs cost almost nothing. Players with a role in an active turn
+never back off: the leader and guessers wait on each other, and checkers
+watch the hints without clicking until they claim cheating. All numbers live
+here so the cadence can be tuned in one place.
+"""
+
+from backend import Phase, Role
+
+# Seconds between reruns per phase, with optional overrides per role.
+PHASE_INTERVALS = {
+    Phase.LOBBY: 2.0,
+    Phase.CARD_MAKING: 2.0,
+    Phase.ACTIVE_TURN: 2.0,
+    Phase.TURN_END: 2.0,
+    Phase.GAME_OVER: 10.0,
+}
+
+ROLE_INTERVALS = {
+    (Phase.CARD_MAKING, Role.CARD_MAKER): 5.0,
+    (Phase.ACTIVE_TURN, Role.LEADER): 1.0,
+    (Phase.ACTIVE_TURN, Role.GUESSER): 1.0,
+}
+
+# Viewers who keep their interval however long they have not interacted.
+NO_BACKOFF = {
+    (Phase.ACTIVE_TURN, Role.LEADER),
+    (Phase.ACTIVE_TURN, Role.GUESSER),
+    (Phase.ACTIVE_TURN, Role.CHECKER),
+}
+
+# After IDLE_AFTER seconds without an interaction the interval doubles, and again
+# for every further IDLE_AFTER seconds, up to MAX_INTERVAL. Intervals that are
+# already longer than MAX_INTERVAL are left as they are.
+IDLE_AFTER = 30.0
+MAX_INTERVAL = 15.0
+
+
+def refresh_interval(
+    phase: Phase, role: Role | None, idle_seconds: float = 0.0, scale: float = 1.0
+) -> float:
+    """Return the seconds between reruns for a viewer.
+
+    idle_seconds is the time since the viewer's session last interacted.
+    """
+    interval = ROLE_INTERVALS.get((phase, role), PHASE_INTERVALS[phase]) * scale
+    if (phase, role) in NO_BACKOFF:
+        return interval
+
+    idle_steps = min(int(idle_seconds // IDLE_AFTER), 8)
+    if not idle_steps:
+        return interval
+    return max(interval, min(interval * 2**idle_steps, MAX_INTERVAL))
@@ -0,0 +1,113 @@
+"""This module builds the end-of-game report once per finished game.
+
+The report summarises the scores per round, the players with the most correct
+guesses, the cards that took the most effort or were never guessed, and the
+hints that hit a taboo word. It is computed in a background thread when the
+game ends, stored on the game and published with the next snapshot, so every
+player renders the same cached result instead of scanning all turns on each
+refresh.
+"""
+
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from backend import Game, Team, Turn
+from game_logging import get_logger
+
+TOP_PLAYERS = 3
+TOP_CARDS = 3
+
+logger = get_logger("report")
+
+
+@dataclass(frozen=True)
+class GameReport:
+    """Data class to hold the summary of a finished game."""
+
+    score: tuple[int, int]
+    winner: Team | None
+    rounds: tuple[tuple[int, int], ...]
+    best_guessers: tuple[tuple[str, int], ...]
+    hardest_cards: tuple[tuple[str, int, int, bool], ...]
+    taboo_hits: tuple[tuple[str, str, str], ...]
+
+
+def build_report(turns: list[Turn]) -> GameReport:
+    """Summarise the turns of a finished game."""
+    rounds: list[tuple[int, int]] = []
+    guessers: Counter = Counter()
+    cards = []
+    taboo_hits = []
+
+    for i, turn in enumerate(turns):
+        if i % 2 == 0:
+            rounds.append((0, 0))
+        a, b = rounds[-1]
+        rounds[-1] = (a + turn.score[0], b + turn.score[1])
+
+        guessed = bool(turn.successfully_guessed)
+        if guessed and turn.guessers and turn.guessers[-1] is not None:
+            guessers[turn.guessers[-1].name] += 1
+
+        cards.append((turn.card.word, len(turn.hints), len(turn.guesses), guessed))
+
+        if turn.tabooed:
+            hinter = turn.hinters[-1] if turn.hinters else None
+            taboo_hits.append(
+                (hinter.name if hinter else "?", turn.card.word, turn.hints[-1])
+            )
+
+    score = (sum(r[0] for r in rounds), sum(r[1] for r in rounds))
+    winner = None
+    if score[0] != score[1]:
+        winner = Team.A if score[0] > score[1] else Team.B
+
+    # Words nobody guessed come first, then the ones that needed most effort.
+    hardest = sorted(cards, key=lambda c: (c[3], -(c[1] + c[2]), c[0]))
+
+    best = sorted(guessers.items(), key=lambda item: (-item[1], item[0]))
+
+    return GameReport(
+        score=score,
+        winner=winner,
+        rounds=tuple(rounds),
+        best_guessers=tuple(best[:TOP_PLAYERS]),
+        hardest_cards=tuple(hardest[:TOP_CARDS]),
+        taboo_hits=tuple(taboo_hits),
+    )
+
+
+class ReportWorker:
+    """Build end-of-game reports in a background thread, once per game."""
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="game-report"
+        )
+        self.pending: set[int] = set()
+        self.lock = threading.Lock()
+
+    def submit(self, game: Game) -> Future | None:
+        """Start building the report of a finished game unless it is under way."""
+        with self.lock:
+            if game.report is not None or id(game) in self.pending:
+                return None
+            self.pending.add(id(game))
+        return self.executor.submit(self.run, game)
+
+    def run(self, game: Game) -> GameReport | None:
+        """Build the report, store it on the game and publish the change."""
+        try:
+            report = build_report(list(game.turns))
+            game.report = report
+            game.touch()
+            logger.info("Game report built", extra={"turns": len(game.turns)})
+            return report
+        except Exception:
+            logger.exception("Game report failed")
+            return None
+        finally:
+            with self.lock:
+                self.pending.discard(id(game))
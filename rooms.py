@@ -0,0 +1,70 @@
+"""This module keeps the games of all rooms hosted by one server process.
+
+Each room is a Game created with the same quotas, read from environment
+variables so an operator can tune them without code changes. The number of
+rooms per process is capped too, so one process's memory stays predictable
+however many rooms clients ask for.
+"""
+
+import os
+import threading
+
+from backend import Game, Quotas
+
+MAX_ROOMS = int(os.environ.get("TABOO_MAX_ROOMS", 50))
+
+QUOTAS = Quotas(
+    max_players=int(os.environ.get("TABOO_MAX_PLAYERS", Quotas.max_players)),
+    max_input_length=int(
+        os.environ.get("TABOO_MAX_INPUT_LENGTH", Quotas.max_input_length)
+    ),
+    max_turns=int(os.environ.get("TABOO_MAX_TURNS", Quotas.max_turns)),
+    max_messages=int(os.environ.get("TABOO_MAX_MESSAGES", Quotas.max_messages)),
+)
+
+
+class RoomLimitError(RuntimeError):
+    """Raised when a new room would exceed the rooms per process quota."""
+
+
+class Rooms:
+    """Thread-safe registry of the rooms hosted by this process."""
+
+    def __init__(self, max_rooms: int = MAX_ROOMS, quotas: Quotas = QUOTAS):
+        self.max_rooms = max_rooms
+        self.quotas = quotas
+        self.games: dict[str, Game] = {}
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    def open(self, room_id: str) -> Game:
+        """Return the game of a room, creating it if there is room for it."""
+        with self.lock:
+            game = self.games.get(room_id)
+            if game is None:
+                if len(self.games) >= self.max_rooms:
+                    self.rejected += 1
+                    raise RoomLimitError(
+                        f"This server already hosts {self.max_rooms} rooms."
+                    )
+                game = self.games[room_id] = Game(quotas=self.quotas)
+            return game
+
+    def close(self, room_id: str):
+        """Drop the game of a room."""
+        with self.lock:
+            self.games.pop(room_id, None)
+
+    def metrics(self) -> dict:
+        """Report room usage and the quota usage of every room."""
+        with self.lock:
+            games = dict(self.games)
+            rejected = self.rejected
+        return {
+            "rooms": [len(games), self.max_rooms],
+            "rejected_rooms": rejected,
+            "quotas": {room_id: game.quota_usage() for room_id, game in games.items()},
+        }
+
+    def __len__(self) -> int:
+        return len(self.games)
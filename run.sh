@@ -2,5 +2,8 @@
 # Run the Taboo game Streamlit app
 
 # Activate virtual environment and run the app
+# The app writes its own rotated JSON logs to logs/taboo.log; only crashes and
+# output from Streamlit itself end up in logs/err.txt.
 source .venv/bin/activate
-streamlit run app.py > logs/log.txt 2> logs/err.txt
+mkdir -p logs
+streamlit run app.py 2> logs/err.txt
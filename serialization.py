@@ -0,0 +1,308 @@
+"""This module provides versioned serialization of Taboo game snapshots.
+
+A snapshot is written as JSON lines: a header line holding the schema version,
+the game settings, the player table, the chat, the prepared cards of each team
+and the role history, followed by one line per turn. Players are stored once
+in the player table and referenced by index everywhere else, enums are stored
+as their position in the enum and datetimes as POSIX timestamps, which keeps
+snapshots compact and lets turns be decoded one at a time without loading the
+whole game.
+"""
+
+import io
+import json
+import time
+from datetime import datetime
+from typing import IO, Iterator
+
+from backend import (
+    Card,
+    Chat,
+    Game,
+    Message,
+    Player,
+    Role,
+    Team,
+    Turn,
+    normalize_word,
+)
+
+SCHEMA_VERSION = 4
+SUPPORTED_VERSIONS = (1, 2, 3, 4)
+
+TEAMS = list(Team)
+ROLES = list(Role)
+
+NO_PLAYER = -1
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot cannot be decoded."""
+
+
+def _encode_player(player: Player) -> list:
+    """Encode a player as a compact row of the player table."""
+    return [
+        player.name,
+        TEAMS.index(player.team),
+        ROLES.index(player.role),
+        int(player.is_cheating),
+        player.score,
+    ]
+
+
+def _decode_player(row: list) -> Player:
+    """Decode a row of the player table."""
+    name, team, role, is_cheating, score = row
+    return Player(
+        name=name,
+        team=TEAMS[team],
+        role=ROLES[role],
+        is_cheating=bool(is_cheating),
+        score=score,
+    )
+
+
+def _player_ref(player: Player | None, index: dict[int, int]) -> int:
+    """Return the player table index of a player."""
+    if player is None:
+        return NO_PLAYER
+    return index.get(id(player), NO_PLAYER)
+
+
+def _player_at(ref: int, players: list[Player]) -> Player | None:
+    """Return the player referenced by a player table index."""
+    return players[ref] if ref != NO_PLAYER else None
+
+
+def _encode_card(card: Card) -> list:
+    """Encode a card as a compact row."""
+    return [card.word, card.taboo_words, card.created_at.timestamp()]
+
+
+def _decode_card(row: list) -> Card:
+    """Decode a card row."""
+    word, taboo_words, created_at = row
+    return Card(
+        word=word,
+        taboo_words=taboo_words,
+        created_at=datetime.fromtimestamp(created_at),
+    )
+
+
+def _encode_turn(turn: Turn, index: dict[int, int]) -> dict:
+    """Encode a turn, referencing players by their table index."""
+    return {
+        "c": _encode_card(turn.card),
+        "h": turn.hints,
+        "hp": [_player_ref(p, index) for p in turn.hinters],
+        "g": turn.guesses,
+        "gp": [_player_ref(p, index) for p in turn.guessers],
+        "m": [turn.max_guesses, turn.max_hints],
+        "e": int(turn.end_turn),
+        "s": list(turn.score),
+        "t": turn.ended_at.timestamp() if turn.ended_at else None,
+    }
+
+
+def _decode_turn(row: dict, players: list[Player]) -> Turn:
+    """Decode a turn row against an already decoded player table."""
+    max_guesses, max_hints = row["m"]
+    ended_at = row.get("t")
+    return Turn(
+        card=_decode_card(row["c"]),
+        hints=list(row["h"]),
+        hinters=[_player_at(ref, players) for ref in row["hp"]],
+        guesses=list(row["g"]),
+        guessers=[_player_at(ref, players) for ref in row["gp"]],
+        max_guesses=max_guesses,
+        max_hints=max_hints,
+        end_turn=bool(row["e"]),
+        score=tuple(row["s"]),
+        ended_at=datetime.fromtimestamp(ended_at) if ended_at else None,
+    )
+
+
+def _encode_header(game: Game, index: dict[int, int]) -> dict:
+    """Encode everything in a game except its turns."""
+    return {
+        "v": SCHEMA_VERSION,
+        "game": [
+            game.current_round,
+            game.current_turn,
+            game.max_rounds,
+            int(game.ongoing),
+            len(game.turns),
+            int(game.auto_assign),
+        ],
+        "players": [_encode_player(p) for p in game.players],
+        "chat": [
+            [_player_ref(m.sender, index), m.content, m.id] for m in game.chat.messages
+        ],
+        "queues": [
+            [TEAMS.index(team), [_encode_card(card) for card in queue]]
+            for team, queue in game.card_queues.items()
+        ],
+        "roles": [
+            [name, ROLES.index(role), count]
+            for (name, role), count in game.role_history.items()
+        ],
+    }
+
+
+def _read_header(line: bytes | str) -> dict:
+    """Parse and validate the header line of a snapshot."""
+    if not line:
+        raise SnapshotError("Snapshot is empty.")
+    header = json.loads(line)
+    version = header.get("v")
+    if version not in SUPPORTED_VERSIONS:
+        raise SnapshotError(
+            f"Unsupported snapshot version {version!r}, expected one of "
+            f"{', '.join(map(str, SUPPORTED_VERSIONS))}."
+        )
+    return header
+
+
+def _dump_line(row, fp: IO[bytes]):
+    """Write one compact JSON line."""
+    fp.write(json.dumps(row, separators=(",", ":")).encode("utf-8"))
+    fp.write(b"\n")
+
+
+def dump(game: Game, fp: IO[bytes]):
+    """Write a snapshot of the game to a binary file object."""
+    index = {id(p): i for i, p in enumerate(game.players)}
+    _dump_line(_encode_header(game, index), fp)
+    for turn in game.turns:
+        _dump_line(_encode_turn(turn, index), fp)
+
+
+def dumps(game: Game) -> bytes:
+    """Return a snapshot of the game as bytes."""
+    buffer = io.BytesIO()
+    dump(game, buffer)
+    return buffer.getvalue()
+
+
+def _game_from_header(header: dict, players: list[Player], turns: list[Turn]) -> Game:
+    """Build a game from a decoded header, player table and turns."""
+    # Games before version 4 have no auto assign flag, queues or role history.
+    current_round, current_turn, max_rounds, ongoing, _, *settings_tail = header["game"]
+    # Messages before version 3 have no id and are numbered from one.
+    chat = Chat(
+        messages=[
+            (
+                Message(
+                    sender=_player_at(ref, players), content=content, id=msg_tail[0]
+                )
+                if msg_tail
+                else Message(sender=_player_at(ref, players), content=content)
+            )
+            for ref, content, *msg_tail in header["chat"]
+        ]
+    )
+    game = Game(
+        players=players,
+        current_round=current_round,
+        current_turn=current_turn,
+        max_rounds=max_rounds,
+        ongoing=bool(ongoing),
+        turns=turns,
+        chat=chat,
+        auto_assign=bool(settings_tail[0]) if settings_tail else False,
+    )
+    for team, rows in header.get("queues", []):
+        for row in rows:
+            card = _decode_card(row)
+            game.card_queues[TEAMS[team]].append(card)
+            game.used_words.add(normalize_word(card.word))
+    for name, role, count in header.get("roles", []):
+        game.role_history[name, ROLES[role]] = count
+    return game
+
+
+def iter_turns(fp: IO[bytes]) -> Iterator[Turn]:
+    """Decode the turns of a snapshot one at a time.
+
+    Only the player table and the current turn are held in memory, so large
+    snapshots can be processed in constant space.
+    """
+    header = _read_header(fp.readline())
+    players = [_decode_player(row) for row in header["players"]]
+    for line in fp:
+        if line.strip():
+            yield _decode_turn(json.loads(line), players)
+
+
+def load(fp: IO[bytes]) -> Game:
+    """Restore a game from a snapshot file object."""
+    header = _read_header(fp.readline())
+    players = [_decode_player(row) for row in header["players"]]
+    turns = [_decode_turn(json.loads(line), players) for line in fp if line.strip()]
+
+    expected = header["game"][4]
+    if len(turns) != expected:
+        raise SnapshotError(
+            f"Snapshot is truncated: expected {expected} turns, got {len(turns)}."
+        )
+    return _game_from_header(header, players, turns)
+
+
+def loads(data: bytes) -> Game:
+    """Restore a game from snapshot bytes."""
+    return load(io.BytesIO(data))
+
+
+def _benchmark_game(number_of_turns: int = 100) -> Game:
+    """Build a game with the given number of finished turns."""
+    game = Game(max_rounds=number_of_turns)
+    for i in range(8):
+        game.add_player(
+            Player(
+                name=f"Player {i}",
+                team=Team.A if i % 2 == 0 else Team.B,
+                role=ROLES[i % 4],
+            )
+        )
+
+    for i in range(number_of_turns):
+        game.make_card(f"word{i}", [f"taboo{i}-{j}" for j in range(5)])
+        turn = game.turns[-1]
+        for j in range(turn.max_hints):
+            turn.add_hint(f"hint{j}", game.players[(i + j) % len(game.players)])
+        for j in range(turn.max_guesses):
+            turn.add_guess(f"guess{j}", game.players[(i + j + 1) % len(game.players)])
+        turn.end_turn = True
+        turn.ended_at = datetime.now()
+        turn.score = (1, 0) if i % 2 == 0 else (0, 1)
+        game.role_history[game.players[i % len(game.players)].name, Role.LEADER] += 1
+
+    game.auto_assign = True
+    for team in (Team.A, Team.B):
+        game.queue_card(team, f"queued{team.name}", [f"taboo{j}" for j in range(5)])
+    return game
+
+
+def benchmark(number_of_turns: int = 100, repeat: int = 50):
+    """Print snapshot and restore timings for a game of the given size."""
+    game = _benchmark_game(number_of_turns)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        data = dumps(game)
+    snapshot_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        restored = loads(data)
+    restore_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    assert dumps(restored) == data, "Round trip changed the snapshot."
+
+    print(f"Turns: {number_of_turns}, snapshot size: {len(data)} bytes")
+    print(f"Snapshot: {snapshot_ms:.2f} ms, restore: {restore_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,340 @@
+"""This module runs headless Taboo games against the backend with scripted bots.
+
+Bots join the game, pick teams and roles, make cards, give hints, guess and
+claim cheating by calling the backend directly, mirroring what the Streamlit
+interfaces do. Invariants of the rules engine are checked after every action
+and games can be run in bulk across a process pool.
+
+Usage:
+    python simulator.py --games 10000 --workers 8
+"""
+
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from backend import (
+    Game,
+    Player,
+    Role,
+    Team,
+    NUMBER_OF_TABOO_WORDS,
+    MIN_PLAYERS,
+    MAX_QUEUED_CARDS,
+)
+
+WORDS = [
+    "apple", "river", "castle", "guitar", "planet", "rocket", "garden", "winter",
+    "pirate", "dragon", "island", "camera", "candle", "forest", "market", "bridge",
+]  # fmt: skip
+
+
+@dataclass
+class BotSettings:
+    """Data class to hold the behaviour of the scripted bots."""
+
+    players: int = 6
+    max_rounds: int = 5
+    correct_guess_chance: float = 0.15
+    taboo_hint_chance: float = 0.03
+    cheat_claim_chance: float = 0.02
+    auto_assign: bool = False
+    queued_cards: int = 0
+
+
+@dataclass
+class SimulationResult:
+    """Data class to hold the outcome of one simulated game."""
+
+    seed: int
+    turns_played: int = 0
+    actions: int = 0
+    score: tuple[int, int] = (0, 0)
+    violations: list[str] = field(default_factory=list)
+
+
+class Simulation:
+    """Drive one game through the backend and record invariant violations."""
+
+    def __init__(self, seed: int, settings: BotSettings):
+        self.rng = random.Random(seed)
+        self.settings = settings
+        self.game = Game(
+            max_rounds=settings.max_rounds, auto_assign=settings.auto_assign
+        )
+        self.result = SimulationResult(seed=seed)
+
+    def check(self, condition: bool, message: str):
+        """Record a violation if the condition does not hold."""
+        if not condition:
+            self.result.violations.append(f"turn {self.game.current_turn}: {message}")
+
+    def join(self):
+        """Join all bots, alternating between the two teams."""
+        for i in range(self.settings.players):
+            self.game.add_player(Player(name=f"Bot {i}"))
+            self.result.actions += 1
+
+        if self.settings.auto_assign:
+            sizes = self.game.team_counts
+            self.check(abs(sizes[Team.A] - sizes[Team.B]) <= 1, "teams are unbalanced")
+            return
+
+        for i, player in enumerate(self.game.players):
+            self.game.assign(player, team=Team.A if i % 2 == 0 else Team.B)
+
+    def pick_roles(self):
+        """Pick roles for the current turn the way players would in add_player."""
+        game = self.game
+        if self.settings.auto_assign:
+            leader = next(p for p in game.players if p.role == Role.LEADER)
+            card_maker = next(p for p in game.players if p.role == Role.CARD_MAKER)
+            return leader, card_maker
+
+        guessing = [p for p in game.players if p.team == game.guessing_team]
+        checking = [p for p in game.players if p.team == game.checking_team]
+
+        leader = self.rng.choice(guessing)
+        card_maker = self.rng.choice(checking)
+        for player in guessing:
+            game.assign(player, role=Role.LEADER if player is leader else Role.GUESSER)
+        for player in checking:
+            game.assign(
+                player, role=Role.CARD_MAKER if player is card_maker else Role.CHECKER
+            )
+        self.result.actions += len(game.players)
+
+        return leader, card_maker
+
+    def make_card(self):
+        """Make a card with a random word and distinct taboo words."""
+        unused = list(self.game.unused_words(WORDS))
+        word = self.rng.choice(unused) if unused else f"word {len(self.game.turns)}"
+        taboo_words = self.rng.sample(
+            [w for w in WORDS if w != word], NUMBER_OF_TABOO_WORDS
+        )
+        self.check(self.game.make_card(word, taboo_words), "unused word was rejected")
+        self.check(not self.game.make_card(word, taboo_words), "used word was accepted")
+        self.result.actions += 1
+
+    def queue_cards(self):
+        """Top up both teams' queues of prepared cards."""
+        game = self.game
+        for team, queue in game.card_queues.items():
+            while len(queue) < self.settings.queued_cards:
+                word = f"queued {self.result.actions}"
+                taboo_words = self.rng.sample(WORDS, NUMBER_OF_TABOO_WORDS)
+                self.check(game.queue_card(team, word, taboo_words), "card not queued")
+                self.check(
+                    not game.queue_card(team, word, taboo_words),
+                    "used word was queued",
+                )
+                self.result.actions += 1
+
+        self.check(
+            all(len(q) <= MAX_QUEUED_CARDS for q in game.card_queues.values()),
+            "card queue overflowed",
+        )
+
+    def play_turn(self, leader: Player):
+        """Play actions until the current turn ends."""
+        game = self.game
+        turn = game.turns[-1]
+        guessers = [p for p in game.players if p.role == Role.GUESSER]
+        checkers = [p for p in game.players if p.role == Role.CHECKER]
+        score_before = game.score
+
+        while not turn.end_turn:
+            roll = self.rng.random()
+
+            if roll < self.settings.cheat_claim_chance:
+                game.end_turn(-1, self.rng.choice(checkers))
+
+            elif not turn.hints or (roll < 0.3 and len(turn.hints) < turn.max_hints):
+                if self.rng.random() < self.settings.taboo_hint_chance:
+                    hint = self.rng.choice(turn.card.taboo_words)
+                else:
+                    hint = f"hint {len(turn.hints)}"
+                game.add_hint(hint, leader)
+                if turn.tabooed:
+                    game.end_turn(-1)
+
+            else:
+                if self.rng.random() < self.settings.correct_guess_chance:
+                    guess = turn.card.word
+                else:
+                    guess = f"guess {len(turn.guesses)}"
+                game.add_guess(guess, self.rng.choice(guessers))
+                if turn.successfully_guessed:
+                    game.end_turn(1)
+                elif len(turn.guesses) >= turn.max_guesses:
+                    game.end_turn(0)
+
+            self.result.actions += 1
+            self.check_turn(turn)
+
+        self.check(turn.score in [(0, 0), (1, 0), (0, 1)], f"bad score {turn.score}")
+        expected = tuple(a + b for a, b in zip(score_before, turn.score))
+        self.check(game.score == expected, f"score {game.score} != {expected}")
+
+    def check_turn(self, turn):
+        """Check the invariants of a turn in progress."""
+        self.check(len(turn.hints) <= turn.max_hints, "too many hints")
+        self.check(len(turn.guesses) <= turn.max_guesses, "too many guesses")
+        self.check(len(turn.hints) == len(turn.hinters), "hints and hinters differ")
+        self.check(
+            len(turn.guesses) == len(turn.guessers), "guesses and guessers differ"
+        )
+        self.check(turn.end_turn or turn.is_ongoing, "turn is over but was not ended")
+
+    def check_assignments(self):
+        """Check the incremental assignment counts against the roster."""
+        game = self.game
+        active = [p for p in game.players if not p.is_idle]
+        self.check(
+            +game.assignments == Counter((p.team, p.role) for p in active)
+            and +game.team_counts == Counter(p.team for p in active)
+            and +game.role_counts == Counter(p.role for p in active),
+            "assignment counts drifted",
+        )
+
+    def check_rotation(self):
+        """Check that the leader and card maker went round each team in turn."""
+        game = self.game
+        for team in (Team.A, Team.B):
+            members = [p for p in game.players if p.team == team]
+            for role in (Role.LEADER, Role.CARD_MAKER):
+                counts = [game.role_history[(p.name, role)] for p in members]
+                self.check(
+                    max(counts) - min(counts) <= 1, f"unfair {role.value} rotation"
+                )
+
+    def next_turn(self) -> bool:
+        """Advance the game and check turn and round progression."""
+        game = self.game
+        turn_before = game.current_turn
+        queued = len(game.card_queues[game.guessing_team])
+        has_next = game.next_turn()
+
+        self.check(game.current_turn == turn_before + 1, "turn did not advance")
+        if has_next:
+            self.check(
+                game.current_round == (game.current_turn + 1) // 2,
+                f"round {game.current_round} does not match turn",
+            )
+            self.check(game.current_round <= game.max_rounds, "too many rounds")
+            self.check(
+                (len(game.turns) == game.current_turn) == bool(queued),
+                "queued card was not played",
+            )
+            if self.settings.auto_assign:
+                self.check(game.check_teams(), "automatic roles are not valid")
+            else:
+                self.check(
+                    all(p.role == Role.UNASSIGNED for p in game.players),
+                    "roles were not reset",
+                )
+            self.check_assignments()
+        else:
+            self.check(turn_before == game.max_turns, "game ended early")
+        return has_next
+
+    def run(self) -> SimulationResult:
+        """Play the whole game."""
+        game = self.game
+        self.join()
+
+        while True:
+            leader, _ = self.pick_roles()
+            self.check(game.check_teams(), "valid teams were rejected")
+            if not game.ongoing:
+                self.check(game.start_game(), "game did not start")
+
+            if len(game.turns) < game.current_turn:
+                self.make_card()
+            self.queue_cards()
+            self.check(len(game.turns) == game.current_turn, "turn and card differ")
+            self.play_turn(leader)
+            self.result.turns_played += 1
+
+            if not self.next_turn():
+                break
+
+        self.check(self.result.turns_played == game.max_turns, "not all turns played")
+        if self.settings.auto_assign:
+            self.check_rotation()
+        self.result.score = game.score
+        return self.result
+
+
+def simulate_game(seed: int, settings: BotSettings | None = None) -> SimulationResult:
+    """Simulate a single game with the given seed."""
+    return Simulation(seed, settings or BotSettings()).run()
+
+
+def run_simulations(
+    games: int,
+    workers: int | None = None,
+    settings: BotSettings | None = None,
+    first_seed: int = 0,
+) -> list[SimulationResult]:
+    """Simulate many games across a process pool."""
+    settings = settings or BotSettings()
+    seeds = range(first_seed, first_seed + games)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        return [simulate_game(seed, settings) for seed in seeds]
+
+    chunksize = max(1, games // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(simulate_game, seeds, [settings] * games, chunksize=chunksize)
+        )
+
+
+def main(argv: list[str] | None = None):
+    """Run the simulator command line interface."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--players", type=int, default=BotSettings.players)
+    parser.add_argument("--rounds", type=int, default=BotSettings.max_rounds)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--auto-assign", action="store_true")
+    parser.add_argument("--queued-cards", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.players < MIN_PLAYERS:
+        parser.error(f"At least {MIN_PLAYERS} players are required.")
+    if args.queued_cards > MAX_QUEUED_CARDS:
+        parser.error(f"At most {MAX_QUEUED_CARDS} cards can be queued per team.")
+
+    settings = BotSettings(
+        players=args.players,
+        max_rounds=args.rounds,
+        auto_assign=args.auto_assign,
+        queued_cards=args.queued_cards,
+    )
+
+    start = time.perf_counter()
+    results = run_simulations(args.games, args.workers, settings, args.seed)
+    elapsed = time.perf_counter() - start
+
+    actions = sum(r.actions for r in results)
+    failed = [r for r in results if r.violations]
+    print(
+        f"{len(results)} games, {actions} actions in {elapsed:.2f} s "
+        f"({len(results) / elapsed:.0f} games/s)"
+    )
+    print(f"{len(failed)} games with invariant violations")
+    for result in failed[:10]:
+        print(f"  seed {result.seed}: {result.violations[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""This module publishes immutable snapshots of the game for lock-free rendering.
+
+Every change to the game publishes a new GameView built from frozen data
+classes. Views of players and turns that did not change are reused from the
+previous snapshot, so publishing only allocates what is new. Readers take the
+current snapshot with a single attribute read and never see a half-applied
+change, such as a hint without its hinter.
+"""
+
+import threading
+from dataclasses import dataclass
+
+from backend import Game, Phase, Player, Role, Team, Turn
+from report import GameReport
+
+
+@dataclass(frozen=True)
+class PlayerView:
+    """Data class to represent a player in a snapshot."""
+
+    name: str
+    team: Team
+    role: Role
+    score: int
+    is_idle: bool
+
+
+@dataclass(frozen=True)
+class TurnView:
+    """Data class to represent a turn in a snapshot."""
+
+    word: str
+    taboo_words: tuple[str, ...]
+    hints: tuple[str, ...]
+    hinters: tuple[str, ...]
+    guesses: tuple[str, ...]
+    guessers: tuple[str, ...]
+    max_hints: int
+    max_guesses: int
+    end_turn: bool
+    score: tuple[int, int]
+
+    @property
+    def hints_left(self) -> int:
+        """Number of hints the leader can still give."""
+        return self.max_hints - len(self.hints)
+
+    @property
+    def guesses_left(self) -> int:
+        """Number of guesses the team can still make."""
+        return self.max_guesses - len(self.guesses)
+
+
+@dataclass(frozen=True)
+class GameView:
+    """Data class to represent an immutable snapshot of the game."""
+
+    revision: int
+    players: tuple[PlayerView, ...]
+    current_round: int
+    current_turn: int
+    max_rounds: int
+    ongoing: bool
+    turns: tuple[TurnView, ...]
+    score: tuple[int, int]
+    phase: Phase
+    guessing_team: Team
+    checking_team: Team
+    report: GameReport | None
+
+    @property
+    def turn(self) -> TurnView | None:
+        """The turn being played, if its card has been made."""
+        if len(self.turns) == self.current_turn:
+            return self.turns[-1]
+        return None
+
+    def player(self, name: str | None) -> PlayerView | None:
+        """Find a player by name."""
+        return next((p for p in self.players if p.name == name), None)
+
+    def team_players(self, team: Team) -> list[PlayerView]:
+        """List the players on a team."""
+        return [p for p in self.players if p.team == team]
+
+
+def player_name(player: Player | None) -> str:
+    """Return the name of a player recorded on a turn."""
+    return player.name if player is not None else "?"
+
+
+def turn_key(turn: Turn) -> tuple:
+    """Return what identifies the state of a turn."""
+    return (
+        len(turn.hints),
+        len(turn.hinters),
+        len(turn.guesses),
+        len(turn.guessers),
+        turn.end_turn,
+        turn.score,
+    )
+
+
+def make_turn_view(turn: Turn) -> TurnView:
+    """Copy a turn into a view, dropping any hint or guess still being added."""
+    hints = len(min(turn.hints, turn.hinters, key=len))
+    guesses = len(min(turn.guesses, turn.guessers, key=len))
+    return TurnView(
+        word=turn.card.word,
+        taboo_words=tuple(turn.card.taboo_words),
+        hints=tuple(turn.hints[:hints]),
+        hinters=tuple(player_name(p) for p in turn.hinters[:hints]),
+        guesses=tuple(turn.guesses[:guesses]),
+        guessers=tuple(player_name(p) for p in turn.guessers[:guesses]),
+        max_hints=turn.max_hints,
+        max_guesses=turn.max_guesses,
+        end_turn=turn.end_turn,
+        score=turn.score,
+    )
+
+
+class SnapshotPublisher:
+    """Build and publish a new GameView every time the game changes."""
+
+    def __init__(self):
+        self.current: GameView | None = None
+        self.player_views: dict[int, tuple[tuple, PlayerView]] = {}
+        self.turn_views: dict[int, tuple[tuple, TurnView]] = {}
+        self.lock = threading.Lock()
+
+    def attach(self, game: Game):
+        """Publish the current state of a game and every later change."""
+        game.listeners.append(self.publish)
+        self.publish(game)
+
+    def publish(self, game: Game):
+        """Build a snapshot of the game, reusing unchanged views."""
+        with self.lock:
+            player_views = {}
+            for player in list(game.players):
+                key = (
+                    player.name,
+                    player.team,
+                    player.role,
+                    player.score,
+                    player.is_idle,
+                )
+                cached = self.player_views.get(id(player))
+                if cached is None or cached[0] != key:
+                    cached = (key, PlayerView(*key))
+                player_views[id(player)] = cached
+
+            turn_views = {}
+            for turn in list(game.turns):
+                key = turn_key(turn)
+                cached = self.turn_views.get(id(turn))
+                if cached is None or cached[0] != key:
+                    cached = (key, make_turn_view(turn))
+                turn_views[id(turn)] = cached
+
+            self.player_views = player_views
+            self.turn_views = turn_views
+
+            turns = tuple(view for _, view in turn_views.values())
+            self.current = GameView(
+                revision=game.revision,
+                players=tuple(view for _, view in player_views.values()),
+                current_round=game.current_round,
+                current_turn=game.current_turn,
+                max_rounds=game.max_rounds,
+                ongoing=game.ongoing,
+                turns=turns,
+                score=(
+                    sum(t.score[0] for t in turns),
+                    sum(t.score[1] for t in turns),
+                ),
+                phase=game.phase,
+                guessing_team=game.guessing_team,
+                checking_team=game.checking_team,
+                report=game.report,
+            )
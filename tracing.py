@@ -0,0 +1,123 @@
+"""This module measures how long game changes take to reach other players' screens.
+
+Every change to the game bumps its revision. The tracer records when each
+revision was made and by which session, and every fragment render reports the
+revision it is showing. The time between a change and the first render of it
+in each other session is its propagation delay, which is summarised per
+fragment as p50/p95/p99 and can be exported to a JSON file. Fragments that
+were off screen, because the current phase does not show them, record no
+delays for the changes they missed meanwhile.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+
+from backend import Game
+
+LATENCY_REPORT_PATH = os.environ.get(
+    "TABOO_LATENCY_REPORT",
+    os.path.join(os.path.dirname(__file__), "logs", "latency.json"),
+)
+
+MAX_REVISIONS = 1000
+MAX_SAMPLES = 10000
+PERCENTILES = (50, 95, 99)
+
+# A fragment that has not rendered for this many refresh intervals is taken
+# to have been off screen, leaving some slack for slow runs.
+OFF_SCREEN_AFTER = 1.5
+
+# Session id of the script run that is currently executing, set at the start
+# of each run so changes can be attributed to the session that made them.
+current_session: ContextVar[str | None] = ContextVar("current_session", default=None)
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Return the nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(p / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class LatencyTracer:
+    """Track revision times and per-fragment propagation delays for one room."""
+
+    def __init__(self, room_id: str = "default"):
+        self.room_id = room_id
+        self.revisions: OrderedDict[int, tuple[float, str | None]] = OrderedDict()
+        # Last revision rendered and when, per (session, fragment).
+        self.seen: dict[tuple[str, str], tuple[int, float]] = {}
+        self.delays: dict[str, deque[float]] = {}
+        self.lock = threading.Lock()
+
+    def attach(self, game: Game):
+        """Start recording the changes made to a game."""
+        game.listeners.append(self.record)
+
+    def record(self, game: Game):
+        """Record the time and author of a new revision."""
+        with self.lock:
+            self.revisions[game.revision] = (time.time(), current_session.get())
+            while len(self.revisions) > MAX_REVISIONS:
+                self.revisions.popitem(last=False)
+
+    def observe(self, session_id: str, fragment: str, revision: int, interval: float):
+        """Record that a session's fragment is rendering the given revision.
+
+        interval is the fragment's refresh interval in seconds. After a longer
+        gap the fragment was off screen, so only its revision is updated.
+        """
+        now = time.time()
+        with self.lock:
+            key = (session_id, fragment)
+            last = self.seen.get(key)
+            self.seen[key] = (revision, now)
+            if last is None:
+                return
+            last_seen, last_rendered = last
+            if (
+                revision <= last_seen
+                or now - last_rendered > interval * OFF_SCREEN_AFTER
+            ):
+                return
+
+            delays = self.delays.setdefault(fragment, deque(maxlen=MAX_SAMPLES))
+            for seen_revision in range(last_seen + 1, revision + 1):
+                made = self.revisions.get(seen_revision)
+                if made is not None and made[1] != session_id:
+                    delays.append(now - made[0])
+
+    def forget(self, session_id: str):
+        """Drop the render state of a session that has left."""
+        with self.lock:
+            for key in [k for k in self.seen if k[0] == session_id]:
+                del self.seen[key]
+
+    def report(self) -> dict:
+        """Summarise propagation delays in milliseconds per fragment."""
+        with self.lock:
+            samples = {name: sorted(d) for name, d in self.delays.items()}
+
+        fragments = {}
+        for name, values in samples.items():
+            fragments[name] = {"count": len(values)}
+            for p in PERCENTILES:
+                fragments[name][f"p{p}_ms"] = round(percentile(values, p) * 1000, 1)
+
+        return {
+            "room": self.room_id,
+            "generated_at": time.time(),
+            "fragments": fragments,
+        }
+
+    def export(self, path: str = LATENCY_REPORT_PATH) -> str:
+        """Write the latency report to a JSON file and return its path."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        return path